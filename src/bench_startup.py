@@ -0,0 +1,150 @@
+"""
+Бенчмарк холодного старту CLI-скриптів обох завдань.
+
+Вимірює:
+  * час імпорту модуля через `python -X importtime`;
+  * час до першого запиту вводу (main.py, process_requests.py) або
+    до завершення роботи (seed.py).
+
+Приклад запуску:
+    python bench_startup.py --runs 10 --max-import-ms 150
+"""
+
+import argparse
+import json
+import os
+import selectors
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.absolute()
+
+# (директорія, модуль, маркер першого запиту вводу або None)
+TARGETS = {
+    "main": (BASE_DIR / "task_2", "main", "Оберіть опцію"),
+    "process_requests": (BASE_DIR / "task_1", "process_requests", "Виконати цей запит"),
+    "seed": (BASE_DIR / "task_1", "seed", None),
+}
+
+
+def measure_import_time(cwd: Path, module: str) -> float:
+    """Повертає кумулятивний час імпорту модуля у мілісекундах"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Не вдалося імпортувати {module}: {proc.stderr.strip()}")
+
+    for line in reversed(proc.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"Модуль {module} відсутній у виводі -X importtime")
+
+
+def measure_first_prompt(cwd: Path, module: str, marker, timeout: float) -> float:
+    """Повертає час (мс) до появи маркера у stdout або до завершення процесу"""
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, f"{module}.py"],
+        cwd=cwd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    output = b""
+    try:
+        if marker is None:
+            proc.communicate(timeout=timeout)
+            return (time.perf_counter() - start) * 1000
+
+        encoded = marker.encode("utf-8")
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            deadline = start + timeout
+            while time.perf_counter() < deadline:
+                if not selector.select(deadline - time.perf_counter()):
+                    break
+                chunk = os.read(proc.stdout.fileno(), 4096)
+                if not chunk:
+                    break
+                output += chunk
+                if encoded in output:
+                    return (time.perf_counter() - start) * 1000
+        raise RuntimeError(f"{module}.py не вивів запит вводу за {timeout} сек.")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+
+def summarize(samples: list) -> dict:
+    """Повертає медіану, мінімум і максимум вибірки"""
+    return {
+        "median": round(statistics.median(samples), 3),
+        "min": round(min(samples), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк холодного старту CLI")
+    parser.add_argument("--runs", type=int, default=5, help="кількість повторів")
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        choices=sorted(TARGETS),
+        default=sorted(TARGETS),
+        help="скрипти для вимірювання",
+    )
+    parser.add_argument(
+        "--skip-prompt",
+        action="store_true",
+        help="вимірювати лише час імпорту (без запуску скриптів)",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=None,
+        help="поріг медіани часу імпорту; перевищення завершує з кодом 1",
+    )
+    args = parser.parse_args()
+
+    report = {}
+    regressions = []
+    for name in args.targets:
+        cwd, module, marker = TARGETS[name]
+        import_samples = [measure_import_time(cwd, module) for _ in range(args.runs)]
+        report[name] = {"import_ms": summarize(import_samples)}
+
+        if not args.skip_prompt:
+            prompt_samples = [
+                measure_first_prompt(cwd, module, marker, args.timeout)
+                for _ in range(args.runs)
+            ]
+            key = "first_prompt_ms" if marker else "total_run_ms"
+            report[name][key] = summarize(prompt_samples)
+
+        median = report[name]["import_ms"]["median"]
+        if args.max_import_ms is not None and median > args.max_import_ms:
+            regressions.append(f"{name}: {median} мс > {args.max_import_ms} мс")
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if regressions:
+        print("Регресія часу імпорту:\n" + "\n".join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Бенчмарк підсумкових таблиць з schema_aggregates.sql.
+
+Порівнює:
+  * читання звітів 10 і 14 з requests.sql (агрегація tasks) та
+    requests_aggregates.sql (підсумкові таблиці);
+  * час вставки, оновлення та видалення завдань з увімкненими та вимкненими
+    тригерами підтримки лічильників.
+
+Зміни даних виконуються в транзакціях, які відкочуються, тому база не змінюється.
+ALTER TABLE ... DISABLE TRIGGER бере ексклюзивне блокування tasks:
+запускати лише на локальній базі.
+
+Приклад запуску:
+    python bench_aggregates.py --runs 20 --rows 10000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+import psycopg2
+from config import BASE_DIR, DB_CONFIG
+from process_requests import parse_sql_file
+from psycopg2.extras import execute_values
+
+REPORT_BLOCKS = ("--(10)", "--(14)")
+COUNT_TRIGGERS = ("tasks_counts_insert", "tasks_counts_update", "tasks_counts_delete")
+
+
+def load_reports(sql_file) -> dict:
+    """Повертає звіти 10 і 14 з SQL файлу у вигляді {номер блоку: запит}"""
+    return {
+        description[:6]: query
+        for description, query in parse_sql_file(sql_file)
+        if description.startswith(REPORT_BLOCKS)
+    }
+
+
+def time_query(cursor, query: str, runs: int) -> list:
+    """Виконує запит runs разів і повертає тривалості у мілісекундах"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        cursor.execute(query)
+        cursor.fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def time_writes(conn, rows: int, triggers_enabled: bool) -> dict:
+    """Вимірює INSERT/UPDATE/DELETE rows завдань і відкочує транзакцію"""
+    timings = {}
+    with conn.cursor() as cursor:
+        if not triggers_enabled:
+            for trigger in COUNT_TRIGGERS:
+                cursor.execute(f"ALTER TABLE tasks DISABLE TRIGGER {trigger}")
+
+        cursor.execute("SELECT id FROM users")
+        user_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT id FROM status")
+        status_ids = [row[0] for row in cursor.fetchall()]
+
+        tasks = [
+            (f"bench {i}", None, random.choice(status_ids), random.choice(user_ids))
+            for i in range(rows)
+        ]
+
+        start = time.perf_counter()
+        inserted = execute_values(
+            cursor,
+            """
+            INSERT INTO tasks (title, description, status_id, user_id)
+            VALUES %s RETURNING id
+            """,
+            tasks,
+            page_size=1000,
+            fetch=True,
+        )
+        timings["insert_ms"] = (time.perf_counter() - start) * 1000
+        ids = [row[0] for row in inserted]
+
+        start = time.perf_counter()
+        cursor.execute(
+            "UPDATE tasks SET status_id = %s WHERE id = ANY(%s)",
+            (random.choice(status_ids), ids),
+        )
+        timings["update_ms"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        cursor.execute("DELETE FROM tasks WHERE id = ANY(%s)", (ids,))
+        timings["delete_ms"] = (time.perf_counter() - start) * 1000
+
+    conn.rollback()
+    return {key: round(value, 3) for key, value in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк підсумкових таблиць")
+    parser.add_argument("--runs", type=int, default=10, help="повтори читання")
+    parser.add_argument("--rows", type=int, default=5000, help="рядків для запису")
+    args = parser.parse_args()
+
+    baseline = load_reports(BASE_DIR / "requests.sql")
+    aggregated = load_reports(BASE_DIR / "requests_aggregates.sql")
+
+    report = {"reads": {}, "writes": {}}
+    with psycopg2.connect(**DB_CONFIG) as conn:
+        with conn.cursor() as cursor:
+            for block, query in baseline.items():
+                base_ms = statistics.median(time_query(cursor, query, args.runs))
+                agg_ms = statistics.median(
+                    time_query(cursor, aggregated[block], args.runs)
+                )
+                report["reads"][block] = {
+                    "tasks_scan_ms": round(base_ms, 3),
+                    "summary_table_ms": round(agg_ms, 3),
+                    "speedup": round(base_ms / agg_ms, 1) if agg_ms else None,
+                }
+        conn.rollback()
+
+        report["writes"]["with_triggers"] = time_writes(conn, args.rows, True)
+        report["writes"]["without_triggers"] = time_writes(conn, args.rows, False)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
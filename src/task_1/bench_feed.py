@@ -0,0 +1,218 @@
+"""
+Бенчмарк стрічки змін tasks: LISTEN/NOTIFY (task_feed.py) проти опитування.
+
+Потік-записувач вставляє завдання невеликими транзакціями із заданою
+швидкістю, а споживач виявляє нові завдання одним зі способів:
+  * notify — TaskChangeListener на каналі task_changes (schema_notify.sql);
+  * poll   — запит "SELECT ... WHERE id > останній" кожні --poll-interval с.
+
+Для кожного способу звітуються затримка виявлення (від COMMIT до отримання
+споживачем, p50/p95/p99) та навантаження на базу: кількість запитів
+споживача і різниця лічильників pg_stat_database за час прогону
+(включно із записувачем, однаковим для обох способів).
+Вставлені завдання видаляються після завершення.
+
+Приклад запуску:
+    python bench_feed.py --duration 10 --rate 200 --poll-interval 0.5
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+
+import psycopg2
+from config import DB_CONFIG
+from psycopg2.extras import execute_values
+from task_feed import TaskChangeListener
+
+DATABASE_COUNTERS = ("xact_commit", "tup_returned", "tup_fetched", "blks_hit")
+
+
+def percentiles(samples: list) -> dict:
+    """Повертає p50/p95/p99 та максимум у мілісекундах"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(p):
+        return round(ordered[min(int(len(ordered) * p), len(ordered) - 1)] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def database_counters(conn) -> dict:
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_stat_clear_snapshot()")
+        cur.execute(
+            f"SELECT {', '.join(DATABASE_COUNTERS)} FROM pg_stat_database "
+            "WHERE datname = current_database()"
+        )
+        return dict(zip(DATABASE_COUNTERS, cur.fetchone()))
+
+
+class Writer(threading.Thread):
+    """Вставляє завдання пакетами з фіксованою швидкістю; запам'ятовує час COMMIT"""
+
+    def __init__(self, rate: int, batch: int, duration: float):
+        super().__init__()
+        self.rate = rate
+        self.batch = batch
+        self.duration = duration
+        self.committed_at = {}
+        self.done = threading.Event()
+
+    def run(self):
+        conn = psycopg2.connect(**DB_CONFIG)
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT id FROM users")
+                user_ids = [row[0] for row in cur.fetchall()]
+                cur.execute("SELECT id FROM status")
+                status_ids = [row[0] for row in cur.fetchall()]
+            conn.commit()
+
+            interval = self.batch / self.rate
+            start = time.perf_counter()
+            next_at = start
+            while time.perf_counter() - start < self.duration:
+                rows = [
+                    (
+                        "feed bench",
+                        None,
+                        random.choice(status_ids),
+                        random.choice(user_ids),
+                    )
+                    for _ in range(self.batch)
+                ]
+                with conn.cursor() as cur:
+                    inserted = execute_values(
+                        cur,
+                        """
+                        INSERT INTO tasks (title, description, status_id, user_id)
+                        VALUES %s RETURNING id
+                        """,
+                        rows,
+                        fetch=True,
+                    )
+                # Час записується до COMMIT: споживач може отримати зміну раніше,
+                # ніж commit() повернеться у записувача
+                committed_at = time.time()
+                for (task_id,) in inserted:
+                    self.committed_at[task_id] = committed_at
+                conn.commit()
+
+                next_at += interval
+                time.sleep(max(next_at - time.perf_counter(), 0))
+        finally:
+            conn.close()
+            self.done.set()
+
+
+def consume_notify(writer: Writer, args) -> tuple:
+    """Споживач LISTEN/NOTIFY; повертає (затримки, кількість запитів)"""
+    latencies = []
+    listener = TaskChangeListener(DB_CONFIG, max_batch=args.max_batch, max_wait=0)
+
+    def handler(batch):
+        for change in batch:
+            committed_at = writer.committed_at.get(change["id"])
+            if change["op"] == "I" and committed_at is not None:
+                latencies.append(change["received_at"] - committed_at)
+
+    writer.start()
+    try:
+        listener.listen(handler, stop=writer.done.is_set, timeout=0.1)
+        # Повідомлення останньої транзакції
+        for _ in range(5):
+            handler(listener.poll_batch(0.1))
+    finally:
+        listener.close()
+    # LISTEN — єдиний запит споживача
+    return latencies, 1
+
+
+def consume_poll(writer: Writer, args) -> tuple:
+    """Споживач з періодичним опитуванням; повертає (затримки, кількість запитів)"""
+    latencies = []
+    queries = 0
+    conn = psycopg2.connect(**DB_CONFIG)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM tasks")
+        last_id = cur.fetchone()[0]
+
+        writer.start()
+        final_polls = 2
+        while final_polls:
+            if writer.done.is_set():
+                final_polls -= 1
+            cur.execute(
+                "SELECT id, status_id, user_id FROM tasks WHERE id > %s ORDER BY id",
+                (last_id,),
+            )
+            queries += 1
+            rows = cur.fetchall()
+            seen_at = time.time()
+            for task_id, _, _ in rows:
+                if task_id in writer.committed_at:
+                    latencies.append(seen_at - writer.committed_at[task_id])
+            if rows:
+                last_id = rows[-1][0]
+            time.sleep(args.poll_interval)
+    conn.close()
+    return latencies, queries
+
+
+def run_mode(mode: str, args) -> dict:
+    consume = consume_notify if mode == "notify" else consume_poll
+    writer = Writer(args.rate, args.batch, args.duration)
+
+    stats_conn = psycopg2.connect(**DB_CONFIG)
+    stats_conn.autocommit = True
+    before = database_counters(stats_conn)
+    latencies, queries = consume(writer, args)
+    writer.join()
+    # Лічильники pg_stat_database публікуються із затримкою
+    time.sleep(1)
+    after = database_counters(stats_conn)
+
+    with stats_conn.cursor() as cur:
+        cur.execute(
+            "DELETE FROM tasks WHERE id = ANY(%s)", (list(writer.committed_at),)
+        )
+    stats_conn.close()
+
+    return {
+        "inserted": len(writer.committed_at),
+        "detected": len(latencies),
+        "latency": percentiles(latencies),
+        "consumer_queries": queries,
+        "database": {key: after[key] - before[key] for key in DATABASE_COUNTERS},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк LISTEN/NOTIFY та опитування")
+    parser.add_argument("--duration", type=float, default=10, help="тривалість, с")
+    parser.add_argument("--rate", type=int, default=200, help="завдань за секунду")
+    parser.add_argument("--batch", type=int, default=10, help="завдань у транзакції")
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    parser.add_argument("--max-batch", type=int, default=500)
+    parser.add_argument("--mode", choices=("notify", "poll", "both"), default="both")
+    args = parser.parse_args()
+
+    modes = ("notify", "poll") if args.mode == "both" else (args.mode,)
+    report = {mode: run_mode(mode, args) for mode in modes}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Бенчмарк серіалізації великих результатів SELECT у JSON (result_encoder.py).
+
+Порівнює:
+  * generic — json.dumps з відступами та default=encode_value для кожного
+    значення, яке не підтримує json (шлях колишнього DateTimeEncoder);
+  * typed   — енкодери колонок за cursor.description (encode_rows), далі
+    json або orjson, з відступами та у компактному режимі.
+
+За замовчуванням використовується синтетичний результат з колонками
+integer, text, timestamp, date, numeric, uuid та bytea; з --query рядки
+беруться з бази даних.
+
+Приклади запуску:
+    python bench_json.py --rows 200000 --runs 3
+    python bench_json.py --query "SELECT * FROM tasks LIMIT 500000"
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import psycopg2
+from config import DB_CONFIG
+from psycopg2.extensions import Column
+from result_encoder import ResultSerializer, encode_rows, encode_value
+
+SYNTHETIC_COLUMNS = (
+    ("id", 23),
+    ("title", 1043),
+    ("created_at", 1114),
+    ("due_date", 1082),
+    ("estimate", 1700),
+    ("external_id", 2950),
+    ("attachment", 17),
+)
+
+
+def synthetic_result(rows: int) -> tuple:
+    """Повертає (рядки, description) синтетичного результату"""
+    description = [
+        Column(name=name, type_code=type_code) for name, type_code in SYNTHETIC_COLUMNS
+    ]
+    start = datetime(2024, 1, 1)
+    data = [
+        (
+            i,
+            f"Завдання {i}",
+            start + timedelta(seconds=random.randint(0, 10**7)),
+            date(2024, 1, 1) + timedelta(days=random.randint(0, 365)),
+            Decimal(random.randint(0, 10**6)) / 100,
+            uuid.uuid4(),
+            memoryview(random.randbytes(16)),
+        )
+        for i in range(rows)
+    ]
+    return data, description
+
+
+def query_result(query: str) -> tuple:
+    """Повертає (рядки, description) результату запиту до бази даних"""
+    with psycopg2.connect(**DB_CONFIG) as conn, conn.cursor() as cur:
+        cur.execute(query)
+        rows, description = cur.fetchall(), cur.description
+    conn.close()
+    return rows, description
+
+
+def measure(serialize, runs: int) -> dict:
+    """Медіанний час серіалізації та розмір результату"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = serialize()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    result = {"ms": round(timings[len(timings) // 2] * 1000, 1)}
+    if isinstance(output, bytes):
+        result["mb"] = round(len(output) / 2**20, 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк серіалізації JSON")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--query", help="SELECT для отримання рядків з бази")
+    args = parser.parse_args()
+
+    rows, description = (
+        query_result(args.query) if args.query else synthetic_result(args.rows)
+    )
+
+    cases = {
+        "generic_indent": lambda: json.dumps(
+            rows, ensure_ascii=False, indent=2, default=encode_value
+        ).encode("utf-8"),
+    }
+    serializers = {
+        "json_indent": ResultSerializer("json"),
+        "json_compact": ResultSerializer("json", compact=True),
+    }
+    try:
+        serializers["orjson_indent"] = ResultSerializer("orjson")
+        serializers["orjson_compact"] = ResultSerializer("orjson", compact=True)
+    except ImportError:
+        print("orjson не встановлено, пропускаємо")
+
+    for name, serializer in serializers.items():
+        cases[f"typed_{name}"] = lambda serializer=serializer: serializer.dumps_bytes(
+            encode_rows(rows, description)
+        )
+
+    report = {"rows": len(rows)}
+    report["encode_rows"] = measure(lambda: encode_rows(rows, description), args.runs)
+    for name, serialize in cases.items():
+        report[name] = measure(serialize, args.runs)
+        report[name]["rows_per_s"] = round(len(rows) / (report[name]["ms"] / 1000))
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
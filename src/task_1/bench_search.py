@@ -0,0 +1,93 @@
+"""
+Бенчмарк повнотекстового пошуку з schema_search.sql.
+
+Для випадкових пар слів з seed.TASK_VOCABULARY вимірює затримку
+ранжованого пошуку зі сторінкою результатів (GIN індекс) та, для порівняння,
+еквівалентного фільтра ILIKE по title/description (повне сканування tasks).
+
+Приклад запуску (після seed.py --tasks 1000000):
+    python bench_search.py --runs 50 --page-size 20
+"""
+
+import argparse
+import json
+import random
+import time
+
+import psycopg2
+from config import DB_CONFIG
+from seed import TASK_VOCABULARY
+
+SEARCH_QUERY = """
+SELECT t.id, t.title, ts_rank(t.search_vector, q) AS rank
+FROM tasks t, websearch_to_tsquery('simple', %(terms)s) AS q
+WHERE t.search_vector @@ q
+ORDER BY rank DESC, t.id
+LIMIT %(limit)s OFFSET %(offset)s
+"""
+
+LIKE_QUERY = """
+SELECT t.id, t.title
+FROM tasks t
+WHERE (t.title ILIKE %(first)s OR t.description ILIKE %(first)s)
+  AND (t.title ILIKE %(second)s OR t.description ILIKE %(second)s)
+ORDER BY t.id
+LIMIT %(limit)s OFFSET %(offset)s
+"""
+
+
+def percentiles(samples: list) -> dict:
+    """Повертає p50/p95/p99 та максимум у мілісекундах"""
+    ordered = sorted(samples)
+
+    def pick(p):
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 3)
+
+    return {"p50": pick(50), "p95": pick(95), "p99": pick(99), "max": pick(100)}
+
+
+def run(cursor, query: str, params_list: list) -> list:
+    """Виконує запит для кожного набору параметрів і повертає тривалості (мс)"""
+    samples = []
+    for params in params_list:
+        start = time.perf_counter()
+        cursor.execute(query, params)
+        cursor.fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк повнотекстового пошуку")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3, help="сторінок на запит")
+    parser.add_argument("--skip-like", action="store_true", help="без порівняння з ILIKE")
+    args = parser.parse_args()
+
+    pairs = [random.sample(TASK_VOCABULARY, 2) for _ in range(args.runs)]
+    params_list = [
+        {
+            "terms": " ".join(pair),
+            "first": f"%{pair[0]}%",
+            "second": f"%{pair[1]}%",
+            "limit": args.page_size,
+            "offset": page * args.page_size,
+        }
+        for pair in pairs
+        for page in range(args.pages)
+    ]
+
+    report = {}
+    with psycopg2.connect(**DB_CONFIG) as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM tasks")
+        report["tasks"] = cursor.fetchone()[0]
+        report["fulltext_ms"] = percentiles(run(cursor, SEARCH_QUERY, params_list))
+        if not args.skip_like:
+            report["ilike_ms"] = percentiles(run(cursor, LIKE_QUERY, params_list))
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
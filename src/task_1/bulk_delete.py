@@ -0,0 +1,215 @@
+"""
+Пакетне видалення рядків з таблиць task_management.
+
+Замість одного DELETE на рядок (або одного DELETE на всю таблицю) рядки,
+що відповідають умові --where, видаляються пакетами в окремих коротких
+транзакціях з паузою між ними:
+  * --key id   — наступні batch_size значень id за індексом первинного ключа;
+  * --key ctid — діапазони фізичних сторінок таблиці (TID Range Scan,
+                 PostgreSQL 14+), без використання індексів; для
+                 секціонованої таблиці обходяться всі її секції.
+
+--truncate — швидкий шлях для повного очищення: TRUNCATE створює нові
+порожні файли таблиці та її індексів. Оскільки TRUNCATE не викликає тригерів
+DELETE, лічильники з schema_aggregates.sql (якщо вони є) скидаються явно.
+
+Приклади:
+    python bulk_delete.py --table tasks --where "status_id = 3" --batch-size 5000
+    python bulk_delete.py --table tasks --key ctid --pages-per-batch 500 --pause 0.1
+    python bulk_delete.py --table tasks --truncate
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable, Optional
+
+import psycopg2
+from config import DB_CONFIG, LOG_CONFIG
+from psycopg2 import sql
+
+logger = logging.getLogger(__name__)
+
+# Лічильники, що підтримуються тригерами на tasks (schema_aggregates.sql)
+COUNTER_TABLES = ("task_counts_by_status", "task_counts_by_user")
+
+
+def log_progress(deleted: int, elapsed: float) -> None:
+    """Стандартний звіт про прогрес: кількість та швидкість видалення"""
+    rate = deleted / elapsed if elapsed else 0
+    logger.info(f"Видалено {deleted} рядків ({rate:.0f} рядків/с)")
+    print(f"Видалено {deleted} рядків ({rate:.0f} рядків/с)", flush=True)
+
+
+def delete_by_id(
+    conn,
+    table: str,
+    where: str = "TRUE",
+    batch_size: int = 5000,
+    pause: float = 0.0,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> int:
+    """Видаляє рядки за умовою пакетами за зростанням id; повертає кількість"""
+    statement = sql.SQL(
+        """
+        WITH batch AS (
+            SELECT id FROM {table}
+            WHERE id > %(last_id)s AND ({where})
+            ORDER BY id
+            LIMIT %(batch_size)s
+        )
+        DELETE FROM {table} t USING batch
+        WHERE t.id = batch.id
+        RETURNING t.id
+        """
+    ).format(table=sql.Identifier(table), where=sql.SQL(where))
+
+    deleted = 0
+    last_id = 0
+    start = time.perf_counter()
+    while True:
+        with conn.cursor() as cur:
+            cur.execute(statement, {"last_id": last_id, "batch_size": batch_size})
+            ids = [row[0] for row in cur.fetchall()]
+        conn.commit()
+        if not ids:
+            break
+
+        deleted += len(ids)
+        last_id = max(ids)
+        if progress:
+            progress(deleted, time.perf_counter() - start)
+        if pause:
+            time.sleep(pause)
+    return deleted
+
+
+def leaf_relations(conn, table: str) -> list:
+    """Таблиці з даними: сама таблиця або всі листові секції секціонованої"""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT relid::regclass::text,
+                   pg_relation_size(relid) / current_setting('block_size')::int
+            FROM pg_partition_tree(%s::regclass)
+            WHERE isleaf
+            ORDER BY relid
+            """,
+            (table,),
+        )
+        relations = cur.fetchall()
+    conn.commit()
+    return relations
+
+
+def delete_by_ctid(
+    conn,
+    table: str,
+    where: str = "TRUE",
+    pages_per_batch: int = 1000,
+    pause: float = 0.0,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> int:
+    """Видаляє рядки за умовою, проходячи таблицю діапазонами сторінок ctid"""
+    deleted = 0
+    start = time.perf_counter()
+    for relation, total_pages in leaf_relations(conn, table):
+        # relation — вивід regclass, вже екранований PostgreSQL
+        statement = sql.SQL(
+            """
+            DELETE FROM {table}
+            WHERE ctid >= format('(%%s,0)', %(low)s::bigint)::tid
+              AND ctid < format('(%%s,0)', %(high)s::bigint)::tid
+              AND ({where})
+            """
+        ).format(table=sql.SQL(relation), where=sql.SQL(where))
+
+        for low in range(0, total_pages, pages_per_batch):
+            with conn.cursor() as cur:
+                cur.execute(statement, {"low": low, "high": low + pages_per_batch})
+                deleted += cur.rowcount
+            conn.commit()
+            if progress:
+                progress(deleted, time.perf_counter() - start)
+            if pause:
+                time.sleep(pause)
+    return deleted
+
+
+def truncate_table(conn, table: str) -> int:
+    """Швидко очищує таблицю через TRUNCATE; повертає кількість видалених рядків"""
+    with conn.cursor() as cur:
+        table_id = sql.Identifier(table)
+        cur.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(table_id))
+        count = cur.fetchone()[0]
+        cur.execute(sql.SQL("TRUNCATE {} RESTART IDENTITY").format(table_id))
+        if table == "tasks":
+            for counter_table in COUNTER_TABLES:
+                cur.execute("SELECT to_regclass(%s)", (counter_table,))
+                if cur.fetchone()[0] is not None:
+                    cur.execute(
+                        sql.SQL("UPDATE {} SET task_count = 0").format(
+                            sql.Identifier(counter_table)
+                        )
+                    )
+    conn.commit()
+    logger.info(f"Таблицю {table} очищено через TRUNCATE ({count} рядків)")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетне видалення рядків")
+    parser.add_argument("--table", default="tasks")
+    parser.add_argument("--where", default="TRUE", help="SQL умова для видалення")
+    parser.add_argument("--key", choices=("id", "ctid"), default="id")
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="рядків (--key id)"
+    )
+    parser.add_argument(
+        "--pages-per-batch", type=int, default=1000, help="сторінок (--key ctid)"
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="пауза між пакетами, с"
+    )
+    parser.add_argument(
+        "--truncate", action="store_true", help="очистити всю таблицю через TRUNCATE"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(**LOG_CONFIG)
+    start = time.perf_counter()
+    try:
+        with psycopg2.connect(**DB_CONFIG) as conn:
+            if args.truncate:
+                deleted = truncate_table(conn, args.table)
+            elif args.key == "ctid":
+                deleted = delete_by_ctid(
+                    conn,
+                    args.table,
+                    args.where,
+                    args.pages_per_batch,
+                    args.pause,
+                    log_progress,
+                )
+            else:
+                deleted = delete_by_id(
+                    conn,
+                    args.table,
+                    args.where,
+                    args.batch_size,
+                    args.pause,
+                    log_progress,
+                )
+        conn.close()
+    except psycopg2.Error as e:
+        logger.error(f"Помилка пакетного видалення: {e}")
+        print(f"Помилка: {e}")
+        return
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Всього видалено {deleted} рядків за {elapsed:.3f} сек.")
+    print(f"Всього видалено {deleted} рядків за {elapsed:.3f} сек.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+from typing import Optional, Set
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS request_run_checkpoints (
+    run_id TEXT NOT NULL,
+    block_hash CHAR(64) NOT NULL,
+    block_index INTEGER NOT NULL,
+    completed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, block_hash)
+)
+"""
+
+
+def block_hash(query: str) -> str:
+    """Повертає SHA-256 вмісту SQL блоку (без крайових пробілів)"""
+    return hashlib.sha256(query.strip().encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Контрольні точки виконання блоків SQL файлу.
+
+    Запис про виконаний блок додається тим самим курсором і в тій самій
+    транзакції, що й зміни блоку, тому після COMMIT блок і його контрольна
+    точка фіксуються атомарно: неідемпотентні INSERT не повторюються при
+    відновленні, а відкочений блок не вважається виконаним.
+    """
+
+    def __init__(self, conn, run_id: str):
+        self.conn = conn
+        self.run_id = run_id
+        self.completed: Set[str] = set()
+
+    @staticmethod
+    def ensure_table(conn) -> None:
+        """Створює таблицю контрольних точок, якщо її немає"""
+        with conn.cursor() as cur:
+            cur.execute(CHECKPOINT_TABLE_SQL)
+        conn.commit()
+
+    @staticmethod
+    def latest_run_id(conn) -> Optional[str]:
+        """Повертає ідентифікатор останнього запуску з контрольними точками"""
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT run_id FROM request_run_checkpoints
+                GROUP BY run_id
+                ORDER BY MAX(completed_at) DESC
+                LIMIT 1
+                """
+            )
+            row = cur.fetchone()
+        conn.commit()
+        return row[0] if row else None
+
+    def load(self) -> Set[str]:
+        """Завантажує хеші вже виконаних блоків поточного запуску"""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT block_hash FROM request_run_checkpoints WHERE run_id = %s",
+                (self.run_id,),
+            )
+            self.completed = {row[0] for row in cur.fetchall()}
+        self.conn.commit()
+        logger.info(
+            f"Запуск {self.run_id}: знайдено {len(self.completed)} виконаних блоків"
+        )
+        return self.completed
+
+    def is_done(self, digest: str) -> bool:
+        return digest in self.completed
+
+    def mark_done(self, cursor, digest: str, index: int) -> None:
+        """Записує контрольну точку в поточній транзакції (без COMMIT)"""
+        try:
+            cursor.execute(
+                """
+                INSERT INTO request_run_checkpoints (run_id, block_hash, block_index)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (run_id, block_hash) DO NOTHING
+                """,
+                (self.run_id, digest, index),
+            )
+        except psycopg2.Error as e:
+            logger.error(f"Помилка запису контрольної точки блоку #{index}: {e}")
+            raise
@@ -0,0 +1,187 @@
+"""
+Колонковий експорт результатів SELECT (Parquet, Arrow IPC або CSV).
+
+Рядки читаються серверним (іменованим) курсором пакетами по batch_size,
+тому ні повний результат, ні його JSON-представлення не тримаються в пам'яті.
+Схема повністю будується з cursor.description до читання рядків, тому
+не залежить від значень першого пакета: типи колонок зберігаються, дати та
+мітки часу записуються як нативні типи Arrow, а не рядки. Колонки типів
+без відповідника (numeric без точності, json, масиви тощо) записуються
+текстом: numeric — str(Decimal), json та масиви — JSON.
+
+Для форматів parquet і arrow потрібен пакет pyarrow (опційна залежність).
+"""
+
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from result_encoder import encode_value
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("json", "parquet", "arrow", "csv")
+
+FILE_EXTENSIONS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+    "csv": ".csv",
+}
+
+# OID типів PostgreSQL -> назва фабрики типу pyarrow
+PG_ARROW_TYPES = {
+    16: "bool_",  # boolean
+    20: "int64",  # bigint
+    21: "int16",  # smallint
+    23: "int32",  # integer
+    25: "string",  # text
+    19: "string",  # name
+    700: "float32",  # real
+    701: "float64",  # double precision
+    1042: "string",  # char(n)
+    1043: "string",  # varchar(n)
+    1082: "date32",  # date
+    1083: "time",  # time
+    1114: "timestamp",  # timestamp
+    1184: "timestamptz",  # timestamptz
+    1186: "duration",  # interval
+    17: "binary",  # bytea
+    2950: "string",  # uuid
+}
+
+
+def import_pyarrow():
+    """Імпортує pyarrow або повідомляє, як його встановити"""
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Для форматів parquet/arrow потрібен pyarrow: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def arrow_type(pa, column):
+    """Повертає тип Arrow для колонки cursor.description або None (текст)"""
+    if column.type_code == 1700:  # numeric
+        if column.precision and column.precision <= 38:
+            return pa.decimal128(column.precision, column.scale or 0)
+        return None
+
+    factory = PG_ARROW_TYPES.get(column.type_code)
+    if factory == "timestamp":
+        return pa.timestamp("us")
+    if factory == "timestamptz":
+        return pa.timestamp("us", tz="UTC")
+    if factory == "time":
+        return pa.time64("us")
+    if factory == "duration":
+        return pa.duration("us")
+    if factory is None:
+        return None
+    return getattr(pa, factory)()
+
+
+def text_value(value: Any) -> str:
+    """Текстове значення колонки без типу Arrow: json та масиви — JSON"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=encode_value)
+    return str(value)
+
+
+def is_streamable(query: str) -> bool:
+    """Чи можна виконати запит через іменований курсор (DECLARE ... CURSOR)"""
+    return query.strip().upper().startswith("SELECT")
+
+
+class ColumnarExporter:
+    """Записує результат кожного SELECT в окремий колонковий файл"""
+
+    def __init__(self, output_format: str, output_dir: Path, batch_size: int = 10000):
+        if output_format not in FILE_EXTENSIONS:
+            raise ValueError(f"Непідтримуваний формат експорту: {output_format}")
+        self.output_format = output_format
+        self.output_dir = Path(output_dir)
+        self.batch_size = batch_size
+        self.counter = 0
+        self.pa = import_pyarrow() if output_format != "csv" else None
+
+    def export(self, conn, query: str) -> Tuple[int, Path]:
+        """Виконує SELECT і записує результат у файл; повертає (кількість рядків, шлях)"""
+        self.counter += 1
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / (
+            f"result_{self.counter:03d}{FILE_EXTENSIONS[self.output_format]}"
+        )
+
+        with conn.cursor(name=f"export_{self.counter}") as cursor:
+            cursor.itersize = self.batch_size
+            cursor.execute(query)
+            # Для іменованого курсора description доступний після першого fetch
+            batch = cursor.fetchmany(self.batch_size)
+            batches = self._iter_batches(cursor, batch)
+
+            if self.output_format == "csv":
+                rows = self._write_csv(path, cursor.description, batches)
+            else:
+                rows = self._write_arrow(path, cursor.description, batches)
+
+        logger.info(f"Експортовано {rows} рядків у {path}")
+        return rows, path
+
+    def _iter_batches(self, cursor, first_batch: List[tuple]):
+        """Генерує пакети рядків, починаючи з уже отриманого"""
+        batch = first_batch
+        while batch:
+            yield batch
+            batch = cursor.fetchmany(self.batch_size)
+
+    def _write_csv(self, path: Path, description, batches) -> int:
+        """Записує пакети у CSV з заголовком з назв колонок"""
+        rows = 0
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([column.name for column in description])
+            for batch in batches:
+                writer.writerows(batch)
+                rows += len(batch)
+        return rows
+
+    def _write_arrow(self, path: Path, description, batches) -> int:
+        """Записує пакети у Parquet або Arrow IPC файл"""
+        pa = self.pa
+        types = [arrow_type(pa, column) for column in description]
+        schema = pa.schema(
+            [
+                pa.field(column.name, column_type or pa.string())
+                for column, column_type in zip(description, types)
+            ]
+        )
+        rows = 0
+
+        writer = self._open_writer(path, schema)
+        try:
+            for batch in batches:
+                arrays = []
+                for values, column_type, field in zip(zip(*batch), types, schema):
+                    if column_type is None:
+                        values = [None if v is None else text_value(v) for v in values]
+                    arrays.append(pa.array(values, type=field.type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                rows += len(batch)
+        finally:
+            writer.close()
+        return rows
+
+    def _open_writer(self, path: Path, schema):
+        """Відкриває потоковий запис файлу відповідного формату"""
+        pa = self.pa
+        if self.output_format == "parquet":
+            return pa.parquet.ParquetWriter(str(path), schema)
+        return pa.ipc.new_file(str(path), schema)
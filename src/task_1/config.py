@@ -22,6 +22,9 @@ FILE_CONFIG = {
     "success_file": BASE_DIR / f"requests_results_success_{TIMESTAMP}.json",
     "error_file": BASE_DIR / f"requests_results_error_{TIMESTAMP}.json",
     "log_file": BASE_DIR / f"process_requests_{TIMESTAMP}.log",
+    "results_dir": BASE_DIR / f"requests_results_{TIMESTAMP}",
+    "fanout_file": BASE_DIR / f"requests_results_fanout_{TIMESTAMP}.json",
+    "server_stats_file": BASE_DIR / f"requests_server_stats_{TIMESTAMP}.json",
 }
 
 # Налаштування логування
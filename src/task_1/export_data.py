@@ -0,0 +1,218 @@
+"""
+Потоковий експорт таблиць або результатів запитів через COPY ... TO STDOUT.
+
+Дані йдуть з сервера безпосередньо у файл (CSV або бінарний формат COPY,
+опційно стиснений gzip) без побудови рядків у Python, тому пам'ять
+не залежить від обсягу експорту.
+
+Паралельний режим (--parallel N, лише для --table) ділить діапазон id
+на блоки по --chunk-size і розподіляє їх між N з'єднаннями. Усі з'єднання
+працюють в одному знімку даних (pg_export_snapshot), тому експорт
+узгоджений, а кожен блок записується в окремий файл part_XXXXXX.
+
+Приклади:
+    python export_data.py --table tasks --output tasks.csv.gz
+    python export_data.py --query "SELECT * FROM users" --output users.csv
+    python export_data.py --table tasks --parallel 4 --chunk-size 200000 \\
+        --format binary --output tasks_export/
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import psycopg2
+from config import DB_CONFIG, LOG_CONFIG
+from psycopg2 import sql
+
+logger = logging.getLogger(__name__)
+
+FORMAT_OPTIONS = {
+    "csv": sql.SQL("FORMAT csv, HEADER"),
+    "binary": sql.SQL("FORMAT binary"),
+}
+
+
+class CountingWriter:
+    """Обгортка файлу, що рахує кількість записаних байтів (до стиснення)"""
+
+    def __init__(self, file):
+        self.file = file
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return self.file.write(data)
+
+
+def open_output(path: Path, compress: bool):
+    """Відкриває бінарний файл для запису, за потреби з gzip-стисненням"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress:
+        return gzip.open(path, "wb", compresslevel=1)
+    return path.open("wb")
+
+
+def copy_to_file(cursor, source: sql.Composable, fmt: str, path: Path, compress: bool):
+    """Виконує COPY (source) TO STDOUT у файл; повертає (рядки, байти)"""
+    statement = sql.SQL("COPY ({}) TO STDOUT WITH ({})").format(
+        source, FORMAT_OPTIONS[fmt]
+    )
+    with open_output(path, compress) as f:
+        writer = CountingWriter(f)
+        cursor.copy_expert(statement, writer, size=1 << 20)
+    return cursor.rowcount, writer.bytes
+
+
+def export_single(source: sql.Composable, fmt: str, output: Path, compress: bool):
+    """Експорт одним з'єднанням в один файл"""
+    with psycopg2.connect(**DB_CONFIG) as conn, conn.cursor() as cur:
+        rows, raw_bytes = copy_to_file(cur, source, fmt, output, compress)
+    conn.close()
+    return {"rows": rows, "raw_bytes": raw_bytes, "files": [str(output)]}
+
+
+def export_parallel(
+    table: str, fmt: str, output_dir: Path, compress: bool, workers: int, chunk: int
+):
+    """Паралельний експорт таблиці блоками за діапазонами id в одному знімку"""
+    table_id = sql.Identifier(table)
+    suffix = (".csv" if fmt == "csv" else ".bin") + (".gz" if compress else "")
+
+    coordinator = psycopg2.connect(**DB_CONFIG)
+    coordinator.set_session(isolation_level="REPEATABLE READ", readonly=True)
+    with coordinator.cursor() as cur:
+        cur.execute("SELECT pg_export_snapshot()")
+        snapshot_id = cur.fetchone()[0]
+        cur.execute(sql.SQL("SELECT MIN(id), MAX(id) FROM {}").format(table_id))
+        min_id, max_id = cur.fetchone()
+
+    chunks = queue.Queue()
+    if min_id is not None:
+        for number, low in enumerate(range(min_id, max_id + 1, chunk)):
+            chunks.put((number, low, low + chunk))
+
+    totals = {"rows": 0, "raw_bytes": 0, "files": []}
+    lock = threading.Lock()
+    errors = []
+
+    def worker():
+        conn = psycopg2.connect(**DB_CONFIG)
+        try:
+            conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
+            with conn.cursor() as cur:
+                cur.execute("SET TRANSACTION SNAPSHOT %s", (snapshot_id,))
+                while True:
+                    try:
+                        number, low, high = chunks.get_nowait()
+                    except queue.Empty:
+                        break
+                    source = sql.SQL(
+                        "SELECT * FROM {} WHERE id >= {} AND id < {} ORDER BY id"
+                    ).format(table_id, sql.Literal(low), sql.Literal(high))
+                    path = output_dir / f"part_{number:06d}{suffix}"
+                    rows, raw_bytes = copy_to_file(cur, source, fmt, path, compress)
+                    with lock:
+                        totals["rows"] += rows
+                        totals["raw_bytes"] += raw_bytes
+                        totals["files"].append(str(path))
+            conn.rollback()
+        except Exception as e:
+            logger.error(f"Помилка паралельного експорту: {e}")
+            with lock:
+                errors.append(str(e))
+        finally:
+            conn.close()
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        # Знімок має існувати, доки всі працівники не імпортують його
+        coordinator.rollback()
+        coordinator.close()
+
+    if errors:
+        raise RuntimeError(f"Експорт завершився з помилками: {errors}")
+    totals["files"].sort()
+    return totals
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Потоковий експорт через COPY")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--table", help="таблиця для експорту (наприклад, tasks)")
+    source.add_argument("--query", help="довільний SELECT для експорту")
+    parser.add_argument("--format", choices=sorted(FORMAT_OPTIONS), default="csv")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="файл (або директорія для --parallel)",
+    )
+    parser.add_argument(
+        "--no-compress", action="store_true", help="не стискати вихід gzip"
+    )
+    parser.add_argument(
+        "--parallel", type=int, default=1, help="кількість з'єднань (лише --table)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=100000, help="діапазон id в одному блоці"
+    )
+    args = parser.parse_args(argv)
+    if args.parallel > 1 and not args.table:
+        parser.error("--parallel підтримується лише разом з --table")
+    return args
+
+
+def main(argv: Optional[list] = None):
+    args = parse_args(argv)
+    logging.basicConfig(**LOG_CONFIG)
+    compress = not args.no_compress
+
+    start = time.perf_counter()
+    if args.parallel > 1:
+        report = export_parallel(
+            args.table,
+            args.format,
+            args.output,
+            compress,
+            args.parallel,
+            args.chunk_size,
+        )
+    else:
+        output = args.output
+        if compress and output.suffix != ".gz":
+            output = output.with_name(output.name + ".gz")
+        if args.table:
+            source = sql.SQL("SELECT * FROM {}").format(sql.Identifier(args.table))
+        else:
+            source = sql.SQL(args.query.strip().rstrip(";"))
+        report = export_single(source, args.format, output, compress)
+
+    elapsed = time.perf_counter() - start
+    written = sum(Path(path).stat().st_size for path in report["files"])
+    report.update(
+        {
+            "elapsed_s": round(elapsed, 3),
+            "written_bytes": written,
+            "raw_mb_per_s": round(report["raw_bytes"] / 2**20 / elapsed, 2),
+            "written_mb_per_s": round(written / 2**20 / elapsed, 2),
+        }
+    )
+    logger.info(f"Експорт завершено: {report['rows']} рядків за {elapsed:.3f} сек.")
+    summary = dict(report, files=len(report["files"]))
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Паралельне виконання блоків SQL файлу на кількох базах даних (тенантах, шардах).
+
+Кожна ціль отримує власне з'єднання та виконує всі блоки послідовно без
+інтерактивного підтвердження; кількість одночасних цілей обмежена --workers.
+Результати позначаються ціллю, а сумісні SELECT об'єднуються:
+  * агрегатні запити (COUNT/SUM/MIN/MAX з GROUP BY або без) — групуються
+    за неагрегатними колонками, агрегати комбінуються (COUNT/SUM сумуються);
+  * інші SELECT — рядки всіх цілей конкатенуються з назвою цілі в першій колонці.
+COUNT(*) об'єднується як COUNT; запити з AVG або DISTINCT (SELECT DISTINCT,
+COUNT(DISTINCT ...)) та SELECT * лише конкатенуються.
+"""
+
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import psycopg2
+import sqlparse
+from checkpoint import block_hash
+from columnar_export import ColumnarExporter
+from process_requests import execute_query, open_checkpoints
+from result_encoder import ResultSerializer
+from sqlparse.sql import Function, Identifier, IdentifierList
+from sqlparse.tokens import DML, Keyword, Wildcard
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_RE = re.compile(
+    r"^\s*(COUNT|SUM|MIN|MAX|AVG)\s*\(\s*(DISTINCT\b)?", re.IGNORECASE
+)
+
+COMBINERS = {
+    "COUNT": lambda a, b: (a or 0) + (b or 0),
+    "SUM": lambda a, b: b if a is None else a if b is None else a + b,
+    "MIN": lambda a, b: b if a is None else a if b is None else min(a, b),
+    "MAX": lambda a, b: b if a is None else a if b is None else max(a, b),
+}
+
+
+class TargetResults:
+    """Накопичує результати однієї цілі (інтерфейс ResultWriter.append_result)"""
+
+    def __init__(self):
+        self.results = []
+
+    def append_result(self, result: Dict, is_success: bool):
+        self.results.append(result)
+
+
+def target_label(dsn: str) -> str:
+    """Повертає назву цілі без пароля: host:port/dbname"""
+    params = psycopg2.extensions.parse_dsn(dsn)
+    return (
+        f"{params.get('host', 'localhost')}:{params.get('port', 5432)}"
+        f"/{params.get('dbname', '')}"
+    )
+
+
+def select_columns(query: str) -> Optional[List[str]]:
+    """Повертає вирази списку SELECT або None, якщо запит не SELECT чи містить *"""
+    statement = sqlparse.parse(query)[0]
+    if statement.get_type() != "SELECT":
+        return None
+
+    seen_select = False
+    for token in statement.tokens:
+        if token.ttype is DML and token.normalized == "SELECT":
+            seen_select = True
+        elif not seen_select or token.is_whitespace:
+            continue
+        elif isinstance(token, IdentifierList):
+            return [str(item) for item in token.get_identifiers()]
+        elif isinstance(token, (Identifier, Function)):
+            return [str(token)]
+        elif token.ttype is Wildcard:
+            return None
+        elif token.ttype is Keyword:
+            # DISTINCT або FROM перед списком колонок
+            return None
+    return None
+
+
+def merge_plan(query: str) -> Optional[List[Optional[str]]]:
+    """
+    Для агрегатного запиту повертає список функцій за колонками
+    (None — ключ групування); для неагрегатного або несумісного — None.
+    """
+    columns = select_columns(query)
+    if not columns:
+        return None
+
+    plan = []
+    for column in columns:
+        match = AGGREGATE_RE.match(column)
+        if match is None:
+            plan.append(None)
+        elif match.group(2):
+            # Значення DISTINCT можуть повторюватись на різних цілях
+            return None
+        elif match.group(1).upper() in COMBINERS:
+            plan.append(match.group(1).upper())
+        else:
+            return None
+    return plan if any(plan) else None
+
+
+def merge_rows(plan: List[Optional[str]], row_sets: List[list]) -> list:
+    """Об'єднує рядки агрегатного запиту з кількох цілей"""
+    merged: Dict[tuple, list] = {}
+    for rows in row_sets:
+        for row in rows:
+            key = tuple(value for value, kind in zip(row, plan) if kind is None)
+            if key not in merged:
+                merged[key] = list(row)
+                continue
+            current = merged[key]
+            for position, kind in enumerate(plan):
+                if kind is not None:
+                    current[position] = COMBINERS[kind](
+                        current[position], row[position]
+                    )
+    return [tuple(row) for row in merged.values()]
+
+
+def merge_results(
+    queries: List[Tuple[str, str]], targets: Dict[str, Dict]
+) -> List[Dict]:
+    """Об'єднує результати SELECT блоків, успішно виконаних на всіх цілях"""
+    merged = []
+    for index, (description, query) in enumerate(queries):
+        per_target = {}
+        for label, target in targets.items():
+            block = target["blocks"].get(index)
+            if block is None or block["status"] != "success":
+                break
+            per_target[label] = block["result"]
+        else:
+            if any(rows is None for rows in per_target.values()):
+                continue  # не SELECT або результат експортовано у файл
+
+            plan = merge_plan(query)
+            if plan is not None:
+                rows = merge_rows(plan, list(per_target.values()))
+                mode = "aggregate"
+            else:
+                rows = [
+                    (label, *row)
+                    for label, result in per_target.items()
+                    for row in result
+                ]
+                mode = "concat"
+            merged.append(
+                {
+                    "description": description,
+                    "query": query,
+                    "merge": mode,
+                    "targets": len(per_target),
+                    "affected_rows": len(rows),
+                    "result": rows,
+                }
+            )
+    return merged
+
+
+def run_target(
+    dsn: str, label: str, queries: List[Tuple[str, str]], args, results_dir: Path
+) -> Dict:
+    """Виконує всі блоки на одній цілі та повертає її результати з часом"""
+    collector = TargetResults()
+    blocks: Dict[int, Dict] = {}
+    start = time.perf_counter()
+    error = None
+
+    exporter = None
+    if args.output_format != "json":
+        safe_label = re.sub(r"[^\w.-]+", "_", label)
+        exporter = ColumnarExporter(
+            args.output_format, results_dir / safe_label, args.batch_size
+        )
+
+    try:
+        with psycopg2.connect(dsn) as conn, conn.cursor() as cur:
+            checkpoints = open_checkpoints(conn, args)
+            for index, (description, query) in enumerate(queries):
+                digest = block_hash(query)
+                if checkpoints and checkpoints.is_done(digest):
+                    continue
+
+                # Рядки лишаються значеннями Python (Decimal, date), щоб
+                # агрегати цілей комбінувались точно; кодуються під час запису звіту
+                result = execute_query(
+                    cur, query, description, collector, exporter, encode_result=False
+                )
+                if result["status"] == "success":
+                    if checkpoints:
+                        checkpoints.mark_done(cur, digest, index + 1)
+                    conn.commit()
+                else:
+                    conn.rollback()
+                blocks[index] = result
+        conn.close()
+    except Exception as e:
+        logger.error(f"Помилка виконання на {label}: {e}")
+        error = str(e)
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Ціль {label}: {len(blocks)} блоків за {elapsed:.3f} сек.")
+    return {
+        "error": error,
+        "elapsed": round(elapsed, 6),
+        "blocks": blocks,
+        "results": collector.results,
+    }
+
+
+def run_fanout(
+    queries: List[Tuple[str, str]],
+    dsns: List[str],
+    args,
+    output_file: Path,
+    results_dir: Path,
+) -> Dict:
+    """Виконує блоки на всіх цілях паралельно та записує звіт у output_file"""
+    start = time.perf_counter()
+    lock = threading.Lock()
+    targets: Dict[str, Dict] = {}
+
+    # Унікальні назви цілей (кілька DSN можуть вказувати на один host/dbname)
+    labels = []
+    for dsn in dsns:
+        label = target_label(dsn)
+        if label in labels:
+            label = f"{label}#{len(labels) + 1}"
+        labels.append(label)
+
+    def run(dsn, label):
+        target = run_target(dsn, label, queries, args, results_dir)
+        with lock:
+            targets[label] = target
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(run, dsns, labels))
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "total_time": round(time.perf_counter() - start, 6),
+        "targets": {
+            label: {
+                "error": target["error"],
+                "elapsed": target["elapsed"],
+                "results": target["results"],
+            }
+            for label, target in sorted(targets.items())
+        },
+        "merged": merge_results(queries, targets),
+    }
+
+    ResultSerializer(args.json_backend, args.compact_json).dump(report, output_file)
+    logger.info(f"Звіт fan-out записано у {output_file}")
+    return report
@@ -1,4 +1,4 @@
-import json
+import argparse
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -6,24 +6,18 @@ from typing import Dict, List, Optional, Tuple
 
 import psycopg2
 import sqlparse
+from checkpoint import CheckpointStore, block_hash
 from colorama import Fore, Style, init
-from config import DB_CONFIG, FILE_CONFIG, LOG_CONFIG
+from columnar_export import OUTPUT_FORMATS, ColumnarExporter, is_streamable
+from config import DB_CONFIG, FILE_CONFIG, LOG_CONFIG, TIMESTAMP
+from result_encoder import JSON_BACKENDS, ResultSerializer, encode_rows
+from server_stats import ServerStats
 
-# Ініціалізація colorama та логування
-init(autoreset=True)
-logging.basicConfig(**LOG_CONFIG)
+# Ініціалізація colorama та логування виконується в main(), щоб імпорт
+# модуля не мав побічних ефектів (створення лог-файлу, обгортання stdout)
 logger = logging.getLogger(__name__)
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Кастомний JSON енкодер для обробки datetime об'єктів"""
-
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
-
 class SQLValidator:
     @staticmethod
     def validate_query(query: str) -> Tuple[bool, Optional[str]]:
@@ -53,7 +47,8 @@ def get_operation_message(query: str, affected: int) -> str:
 class ResultWriter:
     """Клас для роботи з файлами результатів"""
 
-    def __init__(self):
+    def __init__(self, serializer: Optional[ResultSerializer] = None):
+        self.serializer = serializer or ResultSerializer()
         self.success_file = FILE_CONFIG["success_file"]
         self.error_file = FILE_CONFIG["error_file"]
         self.success_results = []
@@ -72,8 +67,7 @@ class ResultWriter:
     def _save_results(self, file_path: Path, results: List[Dict]):
         """Зберігає результати у файл"""
         try:
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
+            self.serializer.dump(results, file_path)
 
             # Розширене логування
             log_msg = [
@@ -101,11 +95,25 @@ def print_colored(text: str, color: Fore, bold: bool = False) -> None:
         print(f"{color}{text}{Style.RESET_ALL}")
 
 
+def snapshot_statements(server_stats: Optional[ServerStats]) -> Optional[Dict]:
+    """Знімок pg_stat_statements; збій з'єднання статистики не впливає на блок"""
+    if server_stats is None:
+        return None
+    try:
+        return server_stats.snapshot_statements()
+    except psycopg2.Error as e:
+        logger.warning(f"Серверну статистику блоку пропущено: {e}")
+        return None
+
+
 def execute_query(
     cursor: psycopg2.extensions.cursor,
     query: str,
     description: str,
     writer: ResultWriter,
+    exporter: Optional[ColumnarExporter] = None,
+    server_stats: Optional[ServerStats] = None,
+    encode_result: bool = True,
 ) -> Dict:
     """Виконує запит і повертає результат"""
     logger.info(f"\nВиконання запиту:\n{query}")
@@ -115,13 +123,28 @@ def execute_query(
         if not is_valid:
             raise ValueError(error)
 
-        start_time = datetime.now()
-        cursor.execute(query)
-        execution_time = (datetime.now() - start_time).total_seconds()
+        stats_before = snapshot_statements(server_stats)
 
-        is_select = query.strip().upper().startswith("SELECT")
-        result = cursor.fetchall() if is_select else None
-        affected = len(result) if is_select else cursor.rowcount
+        result_file = None
+        if exporter is not None and is_streamable(query):
+            # Результат SELECT записується у колонковий файл потоково;
+            # час виконання включає отримання та запис рядків
+            start_time = datetime.now()
+            affected, result_file = exporter.export(cursor.connection, query)
+            execution_time = (datetime.now() - start_time).total_seconds()
+            result = None
+        else:
+            start_time = datetime.now()
+            cursor.execute(query)
+            execution_time = (datetime.now() - start_time).total_seconds()
+
+            # Набір рядків повертають не лише SELECT, а й EXPLAIN, WITH, RETURNING
+            # Значення перетворюються у JSON-сумісні за типами колонок
+            returns_rows = cursor.description is not None
+            result = cursor.fetchall() if returns_rows else None
+            if returns_rows and encode_result:
+                result = encode_rows(result, cursor.description)
+            affected = len(result) if returns_rows else cursor.rowcount
 
         message = get_operation_message(query, affected)
 
@@ -136,6 +159,14 @@ def execute_query(
             "execution_time": execution_time,
             "result": result,
         }
+        if result_file is not None:
+            response["result_file"] = str(result_file)
+        if stats_before is not None:
+            stats_after = snapshot_statements(server_stats)
+            if stats_after is not None:
+                response["server_stats"] = ServerStats.diff_statements(
+                    stats_before, stats_after
+                )
 
         writer.append_result(response, True)
         return response
@@ -154,9 +185,9 @@ def execute_query(
         return error_response
 
 
-def parse_sql_file() -> List[Tuple[str, str]]:
+def parse_sql_file(sql_file: Optional[Path] = None) -> List[Tuple[str, str]]:
     """Читає та валідує SQL файл"""
-    sql_file = FILE_CONFIG["sql_file"]
+    sql_file = Path(sql_file) if sql_file else FILE_CONFIG["sql_file"]
     if not sql_file.exists():
         raise FileNotFoundError(f"Файл {sql_file} не знайдено")
 
@@ -207,18 +238,217 @@ def parse_sql_file() -> List[Tuple[str, str]]:
     return queries
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Розбирає аргументи командного рядка"""
+    parser = argparse.ArgumentParser(description="Виконання SQL запитів з файлу")
+    parser.add_argument(
+        "--sql-file",
+        type=Path,
+        default=FILE_CONFIG["sql_file"],
+        help="файл із SQL запитами (наприклад, requests_partitioned.sql)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="формат результатів SELECT: json (у файлі результатів) або "
+        "колонковий файл для кожного запиту (parquet/arrow потребують pyarrow)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="розмір пакета рядків для колонкового експорту",
+    )
+    parser.add_argument(
+        "--run-id",
+        help="ідентифікатор запуску: виконані блоки записуються в таблицю "
+        "request_run_checkpoints разом зі змінами блоку",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="пропустити блоки, вже виконані в запуску --run-id "
+        "(або в останньому запуску, якщо --run-id не вказано)",
+    )
+    parser.add_argument(
+        "--dsn",
+        action="append",
+        default=[],
+        help="DSN цільової бази; можна вказати кілька разів для виконання "
+        "на всіх базах паралельно (без інтерактивного підтвердження)",
+    )
+    parser.add_argument(
+        "--dsn-file",
+        type=Path,
+        help="файл зі списком DSN, по одному в рядку",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="максимальна кількість баз, що обробляються одночасно",
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="записувати файли результатів без відступів",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=JSON_BACKENDS,
+        default="auto",
+        help="бібліотека запису JSON: orjson (якщо встановлено) або json",
+    )
+    parser.add_argument(
+        "--server-stats",
+        action="store_true",
+        help="додати до результатів серверну статистику з pg_stat_statements "
+        "та зберегти різницю pg_stat(io)_user_tables за весь запуск",
+    )
+    return parser.parse_args(argv)
+
+
+def read_dsns(args: argparse.Namespace) -> List[str]:
+    """Збирає список DSN з аргументів --dsn та файлу --dsn-file"""
+    dsns = list(args.dsn)
+    if args.dsn_file:
+        lines = args.dsn_file.read_text(encoding="utf-8").splitlines()
+        dsns.extend(
+            line.strip() for line in lines if line.strip() and not line.startswith("#")
+        )
+    return dsns
+
+
+def save_server_stats(
+    server_stats: ServerStats,
+    run_statements: Dict,
+    run_tables: Dict,
+    serializer: ResultSerializer,
+) -> None:
+    """Зберігає різницю серверної статистики за весь запуск"""
+    stats_file = FILE_CONFIG["server_stats_file"]
+    try:
+        report = {
+            "statements": ServerStats.diff_statements(
+                run_statements, server_stats.snapshot_statements()
+            ),
+            "tables": ServerStats.diff_tables(
+                run_tables, server_stats.snapshot_tables()
+            ),
+        }
+    except psycopg2.Error as e:
+        logger.warning(f"Серверну статистику запуску не збережено: {e}")
+        return
+    serializer.dump(report, stats_file)
+    logger.info(f"Серверну статистику збережено у {stats_file}")
+    print_colored(f"\nСерверна статистика: {stats_file}", Fore.CYAN)
+
+
+def print_fanout_summary(report: Dict) -> None:
+    """Виводить час виконання на кожній цілі та загальний час"""
+    print_colored("\nРезультати виконання на цілях:", Fore.CYAN, bold=True)
+    for label, target in report["targets"].items():
+        if target["error"]:
+            print_colored(f"{label}: помилка: {target['error']}", Fore.RED)
+            continue
+        failed = sum(1 for r in target["results"] if r["status"] != "success")
+        print_colored(
+            f"{label}: {len(target['results'])} запитів, {failed} помилок, "
+            f"{target['elapsed']:.3f} сек.",
+            Fore.GREEN if not failed else Fore.YELLOW,
+        )
+    print_colored(
+        f"Об'єднано результатів: {len(report['merged'])}. "
+        f"Загальний час: {report['total_time']:.3f} сек.",
+        Fore.GREEN,
+        bold=True,
+    )
+
+
+def open_checkpoints(conn, args: argparse.Namespace) -> Optional[CheckpointStore]:
+    """Готує контрольні точки, якщо вказано --run-id або --resume"""
+    if not args.run_id and not args.resume:
+        return None
+
+    CheckpointStore.ensure_table(conn)
+    run_id = args.run_id
+    if args.resume and not run_id:
+        run_id = CheckpointStore.latest_run_id(conn)
+        if run_id is None:
+            raise ValueError("Немає запусків з контрольними точками для відновлення")
+
+    checkpoints = CheckpointStore(conn, run_id or TIMESTAMP)
+    if args.resume:
+        checkpoints.load()
+    print_colored(f"Ідентифікатор запуску: {checkpoints.run_id}", Fore.CYAN)
+    return checkpoints
+
+
+def main(argv: Optional[List[str]] = None):
     """Основна функція програми"""
+    args = parse_args(argv)
+    init(autoreset=True)
+    logging.basicConfig(**LOG_CONFIG)
+
     start_time = datetime.now()
     logger.info(f"Початок виконання скрипту: {start_time.isoformat()}")
 
     try:
         # Спочатку валідуємо всі запити
-        queries = parse_sql_file()
+        queries = parse_sql_file(args.sql_file)
+
+        dsns = read_dsns(args)
+        if dsns:
+            from fanout import run_fanout
+
+            report = run_fanout(
+                queries,
+                dsns,
+                args,
+                FILE_CONFIG["fanout_file"],
+                FILE_CONFIG["results_dir"],
+            )
+            print_fanout_summary(report)
+            print_colored(f"Звіт: {FILE_CONFIG['fanout_file']}", Fore.GREEN)
+            return
+
+        serializer = ResultSerializer(args.json_backend, args.compact_json)
+        # У консоль результат завжди виводиться з відступами
+        console = ResultSerializer(args.json_backend)
+        writer = ResultWriter(serializer)
+        exporter = (
+            ColumnarExporter(
+                args.output_format, FILE_CONFIG["results_dir"], args.batch_size
+            )
+            if args.output_format != "json"
+            else None
+        )
+        server_stats = ServerStats.connect(DB_CONFIG) if args.server_stats else None
+        if server_stats:
+            try:
+                run_statements = server_stats.snapshot_statements()
+                run_tables = server_stats.snapshot_tables()
+            except psycopg2.Error as e:
+                logger.warning(f"Серверну статистику вимкнено: {e}")
+                print_colored(f"Серверну статистику вимкнено: {e}", Fore.YELLOW)
+                server_stats.close()
+                server_stats = None
 
-        writer = ResultWriter()
         with psycopg2.connect(**DB_CONFIG) as conn, conn.cursor() as cur:
+            checkpoints = open_checkpoints(conn, args)
             for i, (description, query) in enumerate(queries, 1):
+                digest = block_hash(query)
+                if checkpoints and checkpoints.is_done(digest):
+                    logger.info(
+                        f"Запит #{i} вже виконано в запуску {checkpoints.run_id}"
+                    )
+                    print_colored(
+                        f"\nЗапит {i}/{len(queries)} вже виконано, пропускаємо",
+                        Fore.YELLOW,
+                    )
+                    continue
+
                 print_colored(f"\nЗапит {i}/{len(queries)}:", Fore.CYAN, bold=True)
                 print_colored("Опис:", Fore.GREEN)
                 print(description)
@@ -232,21 +462,31 @@ def main():
                     print_colored("Запит пропущено", Fore.YELLOW)
                     continue
 
-                result = execute_query(cur, query, description, writer)
-                print_colored("\nРезультат:", Fore.GREEN, bold=True)
-                print(
-                    json.dumps(
-                        result, ensure_ascii=False, indent=2, cls=DateTimeEncoder
-                    )
+                result = execute_query(
+                    cur, query, description, writer, exporter, server_stats
                 )
+                print_colored("\nРезультат:", Fore.GREEN, bold=True)
+                print(console.dumps(result))
 
                 if result["status"] == "success":
-                    conn.commit()
+                    try:
+                        # Контрольна точка фіксується в одній транзакції з блоком
+                        if checkpoints:
+                            checkpoints.mark_done(cur, digest, i)
+                        conn.commit()
+                    except psycopg2.Error as e:
+                        conn.rollback()
+                        print_colored(f"\nПомилка фіксації: {e}", Fore.RED)
+                        continue
                     print_colored(f"\n{result['message']}", Fore.GREEN)
                 else:
                     conn.rollback()
                     print_colored(f"\nПомилка: {result['error']}", Fore.RED)
 
+        if server_stats:
+            save_server_stats(server_stats, run_statements, run_tables, serializer)
+            server_stats.close()
+
         # Очищення в кінці роботи
         writer.cleanup()
         logger.info("Скрипт завершено успішно")
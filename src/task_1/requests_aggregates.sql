@@ -0,0 +1,9 @@
+-- (10) Отримати кількість завдань для кожного статусу (з підсумкової таблиці):
+SELECT s.name, COALESCE(c.task_count, 0) AS task_count
+FROM status s
+LEFT JOIN task_counts_by_status c ON s.id = c.status_id;
+
+-- (14) Отримати користувачів та кількість їхніх завдань (з підсумкової таблиці):
+SELECT u.id, u.fullname, COALESCE(c.task_count, 0) AS task_count
+FROM users u
+LEFT JOIN task_counts_by_user c ON u.id = c.user_id;
@@ -0,0 +1,55 @@
+-- (P1) Завдання певного користувача за останні 30 днів (наприклад `user_id = 1`):
+SELECT * FROM tasks
+WHERE user_id = 1
+  AND created_at >= CURRENT_DATE - INTERVAL '30 days';
+
+-- (P2) Завдання зі статусом 'new', створені в поточному місяці:
+SELECT * FROM tasks
+WHERE status_id = (SELECT id FROM status WHERE name = 'new')
+  AND created_at >= date_trunc('month', CURRENT_DATE)
+  AND created_at < date_trunc('month', CURRENT_DATE) + INTERVAL '1 month';
+
+-- (P3) Незавершені завдання за останній тиждень:
+SELECT * FROM tasks
+WHERE status_id <> (SELECT id FROM status WHERE name='completed')
+  AND created_at >= CURRENT_DATE - INTERVAL '7 days';
+
+-- (P4) Кількість завдань для кожного статусу за останні 90 днів:
+SELECT s.name, COUNT(t.id) AS task_count
+FROM status s
+LEFT JOIN tasks t ON s.id = t.status_id
+  AND t.created_at >= CURRENT_DATE - INTERVAL '90 days'
+GROUP BY s.name;
+
+-- (P5) Кількість завдань за місяцями за останній рік:
+SELECT date_trunc('month', created_at) AS month, COUNT(*) AS task_count
+FROM tasks
+WHERE created_at >= date_trunc('month', CURRENT_DATE) - INTERVAL '11 months'
+GROUP BY month
+ORDER BY month;
+
+-- (P6) Користувачі та кількість їхніх завдань за останні 30 днів:
+SELECT u.id, u.fullname, COUNT(t.id) AS task_count
+FROM users u
+LEFT JOIN tasks t ON u.id = t.user_id
+  AND t.created_at >= CURRENT_DATE - INTERVAL '30 days'
+GROUP BY u.id, u.fullname;
+
+-- (P7) План запиту P1: секції поза вікном відсікаються (Subplans Removed):
+EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF)
+SELECT * FROM tasks
+WHERE user_id = 1
+  AND created_at >= CURRENT_DATE - INTERVAL '30 days';
+
+-- (P8) План запиту з фіксованим діапазоном дат (відсікання під час планування, наприклад липень 2025):
+EXPLAIN (COSTS OFF)
+SELECT * FROM tasks
+WHERE created_at >= '2025-07-01' AND created_at < '2025-08-01';
+
+-- (P9) План агрегації P4: сканування лише секцій за останні 90 днів:
+EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF)
+SELECT s.name, COUNT(t.id) AS task_count
+FROM status s
+LEFT JOIN tasks t ON s.id = t.status_id
+  AND t.created_at >= CURRENT_DATE - INTERVAL '90 days'
+GROUP BY s.name;
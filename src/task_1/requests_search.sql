@@ -0,0 +1,44 @@
+-- (S1) Пошук завдань за словами 'звіт' та 'проєкт' (перша сторінка, 20 результатів за релевантністю):
+SELECT t.id, t.title, ts_rank(t.search_vector, q) AS rank,
+       ts_headline('simple', t.description, q) AS snippet
+FROM tasks t, websearch_to_tsquery('simple', 'звіт проєкт') AS q
+WHERE t.search_vector @@ q
+ORDER BY rank DESC, t.id
+LIMIT 20 OFFSET 0;
+
+-- (S2) Той самий пошук, друга сторінка результатів:
+SELECT t.id, t.title, ts_rank(t.search_vector, q) AS rank,
+       ts_headline('simple', t.description, q) AS snippet
+FROM tasks t, websearch_to_tsquery('simple', 'звіт проєкт') AS q
+WHERE t.search_vector @@ q
+ORDER BY rank DESC, t.id
+LIMIT 20 OFFSET 20;
+
+-- (S3) Пошук фрази або будь-якого зі слів ('"план робіт" or зустріч'):
+SELECT t.id, t.title, ts_rank_cd(t.search_vector, q) AS rank
+FROM tasks t, websearch_to_tsquery('simple', '"план робіт" or зустріч') AS q
+WHERE t.search_vector @@ q
+ORDER BY rank DESC, t.id
+LIMIT 20;
+
+-- (S4) Кількість знайдених завдань для кожного статусу (для фасетів результатів пошуку):
+SELECT s.name, COUNT(*) AS task_count
+FROM tasks t
+JOIN status s ON s.id = t.status_id
+WHERE t.search_vector @@ websearch_to_tsquery('simple', 'звіт')
+GROUP BY s.name;
+
+-- (S5) Пошук за префіксом слова ('проє*') у завданнях конкретного користувача (user_id=1):
+SELECT t.id, t.title, ts_rank(t.search_vector, q) AS rank
+FROM tasks t, to_tsquery('simple', 'проє:*') AS q
+WHERE t.search_vector @@ q AND t.user_id = 1
+ORDER BY rank DESC, t.id
+LIMIT 20;
+
+-- (S6) План запиту S1: використовується Bitmap Index Scan по tasks_search_vector_idx:
+EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF)
+SELECT t.id, t.title, ts_rank(t.search_vector, q) AS rank
+FROM tasks t, websearch_to_tsquery('simple', 'звіт проєкт') AS q
+WHERE t.search_vector @@ q
+ORDER BY rank DESC, t.id
+LIMIT 20;
@@ -0,0 +1,222 @@
+"""
+Серіалізація результатів запитів у JSON.
+
+Рядки SELECT перетворюються у JSON-сумісні значення одразу після fetchall():
+для кожної колонки енкодер обирається один раз за OID типу з cursor.description
+(PG_JSON_ENCODERS), тому для кожного значення виконується лише виклик
+готової функції без перевірок isinstance. Колонки, значення яких вже
+сумісні з JSON (числа, текст, bool, json/jsonb), не обробляються взагалі.
+Значення колонок невідомих типів та решта об'єктів звіту кодуються
+диспетчеризацією за типом Python (TYPE_ENCODERS, encode_value).
+Значення numeric завжди записуються рядками (str(Decimal)): колонка має
+один тип JSON, а точність і масштаб зберігаються.
+
+Нові типи можна підключити через register_oid_encoder / register_type_encoder.
+
+ResultSerializer записує JSON стандартним модулем json або, якщо встановлено,
+пакетом orjson (опційна залежність: pip install orjson); режим compact
+вимикає відступи.
+"""
+
+import base64
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+JSON_BACKENDS = ("auto", "json", "orjson")
+
+
+def encode_isoformat(value) -> str:
+    return value.isoformat()
+
+
+def encode_decimal(value: Decimal) -> str:
+    """numeric: завжди рядок — без втрати точності та масштабу (2.00 -> "2.00")"""
+    return str(value)
+
+
+def encode_bytes(value) -> str:
+    """bytea у base64"""
+    return base64.b64encode(value).decode("ascii")
+
+
+def encode_interval(value: timedelta) -> float:
+    """interval у секундах"""
+    return value.total_seconds()
+
+
+def encode_array(element: Callable) -> Callable:
+    """Енкодер масиву PostgreSQL (у т.ч. багатовимірного) з енкодером елементів"""
+
+    def encode(values):
+        encoded = []
+        for value in values:
+            if value is None:
+                encoded.append(None)
+            elif isinstance(value, list):
+                encoded.append(encode(value))
+            else:
+                encoded.append(element(value))
+        return encoded
+
+    return encode
+
+
+# OID типів PostgreSQL -> енкодер значення (None — значення вже сумісне з JSON)
+PG_JSON_ENCODERS: Dict[int, Optional[Callable]] = {
+    16: None,  # boolean
+    20: None,  # bigint
+    21: None,  # smallint
+    23: None,  # integer
+    26: None,  # oid
+    700: None,  # real
+    701: None,  # double precision
+    19: None,  # name
+    25: None,  # text
+    1042: None,  # char(n)
+    1043: None,  # varchar(n)
+    114: None,  # json
+    3802: None,  # jsonb
+    1082: encode_isoformat,  # date
+    1083: encode_isoformat,  # time
+    1266: encode_isoformat,  # timetz
+    1114: encode_isoformat,  # timestamp
+    1184: encode_isoformat,  # timestamptz
+    1186: encode_interval,  # interval
+    1700: encode_decimal,  # numeric
+    2950: str,  # uuid
+    17: encode_bytes,  # bytea
+    1000: None,  # boolean[]
+    1005: None,  # smallint[]
+    1007: None,  # integer[]
+    1016: None,  # bigint[]
+    1009: None,  # text[]
+    1015: None,  # varchar[]
+    1182: encode_array(encode_isoformat),  # date[]
+    1115: encode_array(encode_isoformat),  # timestamp[]
+    1185: encode_array(encode_isoformat),  # timestamptz[]
+    1231: encode_array(encode_decimal),  # numeric[]
+    2951: encode_array(str),  # uuid[]
+}
+
+# Тип Python -> енкодер (для колонок невідомих типів та решти звіту)
+TYPE_ENCODERS: Dict[type, Callable] = {
+    datetime: encode_isoformat,
+    date: encode_isoformat,
+    time: encode_isoformat,
+    timedelta: encode_interval,
+    Decimal: encode_decimal,
+    UUID: str,
+    memoryview: encode_bytes,
+    bytes: encode_bytes,
+    set: list,
+    frozenset: list,
+}
+
+
+def register_oid_encoder(type_code: int, encoder: Optional[Callable]) -> None:
+    """Задає енкодер для колонок з OID типу type_code"""
+    PG_JSON_ENCODERS[type_code] = encoder
+
+
+def register_type_encoder(python_type: type, encoder: Callable) -> None:
+    """Задає енкодер для значень типу Python python_type"""
+    TYPE_ENCODERS[python_type] = encoder
+
+
+def encode_value(value: Any) -> Any:
+    """Кодує значення за його типом Python (default для json/orjson)"""
+    encoder = TYPE_ENCODERS.get(type(value))
+    if encoder is None:
+        for base in type(value).__mro__[1:]:
+            encoder = TYPE_ENCODERS.get(base)
+            if encoder is not None:
+                break
+        else:
+            raise TypeError(f"Тип {type(value).__name__} не підтримується в JSON")
+    return encoder(value)
+
+
+def encode_json_compatible(value: Any) -> Any:
+    """Енкодер колонки невідомого типу: JSON-сумісні значення без змін"""
+    if isinstance(value, (str, int, float, bool, list, dict)):
+        return value
+    return encode_value(value)
+
+
+def column_encoders(description) -> List[Optional[Callable]]:
+    """Енкодери колонок за cursor.description (визначаються один раз на запит)"""
+    return [
+        PG_JSON_ENCODERS.get(column.type_code, encode_json_compatible)
+        for column in description
+    ]
+
+
+def encode_rows(rows: list, description) -> List[list]:
+    """Перетворює рядки результату у списки JSON-сумісних значень"""
+    encoders = column_encoders(description)
+    if not rows or all(encoder is None for encoder in encoders):
+        return [list(row) for row in rows]
+
+    # Кодування по колонках: один list comprehension на колонку замість
+    # вкладеного циклу по рядках і колонках
+    columns = [
+        (
+            column
+            if encoder is None
+            else [None if value is None else encoder(value) for value in column]
+        )
+        for column, encoder in zip(zip(*rows), encoders)
+    ]
+    return [list(row) for row in zip(*columns)]
+
+
+def import_orjson():
+    """Імпортує orjson або повідомляє, як його встановити"""
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError(
+            "Для --json-backend orjson потрібен orjson: pip install orjson"
+        ) from e
+    return orjson
+
+
+class ResultSerializer:
+    """Запис звітів у JSON обраним бекендом (json або orjson)"""
+
+    def __init__(self, backend: str = "auto", compact: bool = False):
+        if backend == "auto":
+            try:
+                import_orjson()
+                backend = "orjson"
+            except ImportError:
+                backend = "json"
+        self.backend = backend
+        self.compact = compact
+        if backend == "orjson":
+            self._orjson = import_orjson()
+            self._options = self._orjson.OPT_NON_STR_KEYS
+            if not compact:
+                self._options |= self._orjson.OPT_INDENT_2
+
+    def dumps_bytes(self, obj) -> bytes:
+        if self.backend == "orjson":
+            return self._orjson.dumps(obj, default=encode_value, option=self._options)
+        return self.dumps(obj).encode("utf-8")
+
+    def dumps(self, obj) -> str:
+        if self.backend == "orjson":
+            return self.dumps_bytes(obj).decode("utf-8")
+        if self.compact:
+            return json.dumps(
+                obj, ensure_ascii=False, separators=(",", ":"), default=encode_value
+            )
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=encode_value)
+
+    def dump(self, obj, file_path: Path) -> None:
+        """Записує obj у файл file_path (UTF-8)"""
+        file_path.write_bytes(self.dumps_bytes(obj))
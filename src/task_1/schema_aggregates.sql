@@ -0,0 +1,84 @@
+BEGIN;
+
+-- Опційне розширення схеми: підсумкові таблиці з кількістю завдань за статусом
+-- та за користувачем, які підтримуються тригерами на tasks.
+-- Застосовується після schema.sql (або schema_partitioned.sql).
+-- Звіти 10 і 14 з requests.sql читають ці таблиці замість агрегації всієї tasks
+-- (див. requests_aggregates.sql).
+--
+-- Тригери рівня інструкції з transition tables оновлюють лічильники одним
+-- INSERT ... ON CONFLICT на інструкцію, а не на кожен рядок, тому пакетні
+-- вставки (seed.py) не множать накладні витрати. Рядки лічильників для
+-- статусів є "гарячими": паралельні транзакції, що змінюють завдання з однаковим
+-- статусом, серіалізуються на блокуванні відповідного рядка до COMMIT.
+
+DROP TABLE IF EXISTS task_counts_by_status CASCADE;
+DROP TABLE IF EXISTS task_counts_by_user CASCADE;
+
+-- Кількість завдань для кожного статусу.
+CREATE TABLE task_counts_by_status (
+    status_id INTEGER PRIMARY KEY REFERENCES status (id) ON DELETE CASCADE,
+    task_count BIGINT NOT NULL DEFAULT 0
+);
+
+-- Кількість завдань для кожного користувача.
+CREATE TABLE task_counts_by_user (
+    user_id INTEGER PRIMARY KEY REFERENCES users (id) ON DELETE CASCADE,
+    task_count BIGINT NOT NULL DEFAULT 0
+);
+
+-- Застосовує до лічильників різницю між новими та старими рядками інструкції.
+-- Для INSERT old_rows порожня, для DELETE порожня new_rows.
+CREATE OR REPLACE FUNCTION apply_task_count_delta() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO task_counts_by_status AS c (status_id, task_count)
+        SELECT status_id, COUNT(*) FROM new_rows GROUP BY status_id
+        ON CONFLICT (status_id) DO UPDATE SET task_count = c.task_count + EXCLUDED.task_count;
+
+        INSERT INTO task_counts_by_user AS c (user_id, task_count)
+        SELECT user_id, COUNT(*) FROM new_rows GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE SET task_count = c.task_count + EXCLUDED.task_count;
+    END IF;
+
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE task_counts_by_status AS c
+        SET task_count = c.task_count - d.cnt
+        FROM (SELECT status_id, COUNT(*) AS cnt FROM old_rows GROUP BY status_id) d
+        WHERE c.status_id = d.status_id;
+
+        UPDATE task_counts_by_user AS c
+        SET task_count = c.task_count - d.cnt
+        FROM (SELECT user_id, COUNT(*) AS cnt FROM old_rows GROUP BY user_id) d
+        WHERE c.user_id = d.user_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables дозволені лише для однієї події на тригер,
+-- тому для кожної операції створюється окремий тригер.
+CREATE TRIGGER tasks_counts_insert
+    AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_count_delta();
+
+CREATE TRIGGER tasks_counts_update
+    AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_count_delta();
+
+CREATE TRIGGER tasks_counts_delete
+    AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_task_count_delta();
+
+-- Початкове заповнення лічильників з наявних даних.
+INSERT INTO task_counts_by_status (status_id, task_count)
+SELECT status_id, COUNT(*) FROM tasks GROUP BY status_id;
+
+INSERT INTO task_counts_by_user (user_id, task_count)
+SELECT user_id, COUNT(*) FROM tasks GROUP BY user_id;
+
+COMMIT;
@@ -0,0 +1,78 @@
+BEGIN;
+
+-- Опційне розширення схеми: стрічка змін tasks через LISTEN/NOTIFY.
+-- Застосовується після schema.sql (або schema_partitioned.sql).
+-- Після COMMIT кожної інструкції INSERT або UPDATE status_id слухачі каналу
+-- task_changes (task_feed.py) отримують компактні JSON повідомлення:
+--   {"op": "I", "ts": 1700000000.123, "rows": [[id, status_id, user_id], ...]}
+--   {"op": "U", "ts": 1700000000.123, "rows": [[id, old_status_id, new_status_id], ...]}
+-- де ts — час сервера (epoch, секунди) на момент виконання інструкції.
+--
+-- Тригери рівня інструкції з transition tables надсилають одне повідомлення
+-- на пакет рядків, а не на кожен рядок. Розмір повідомлення NOTIFY
+-- обмежений 8000 байтами, тому пакет ділиться на частини по 200 рядків.
+-- UPDATE без зміни status_id повідомлень не створює.
+--
+-- Вимкнення:
+--   DROP TRIGGER tasks_notify_insert ON tasks;
+--   DROP TRIGGER tasks_notify_update ON tasks;
+
+DROP TRIGGER IF EXISTS tasks_notify_insert ON tasks;
+DROP TRIGGER IF EXISTS tasks_notify_update ON tasks;
+
+CREATE OR REPLACE FUNCTION notify_task_changes() RETURNS TRIGGER AS $$
+DECLARE
+    payload TEXT;
+    sent_at NUMERIC := round(extract(epoch FROM clock_timestamp()), 6);
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR payload IN
+            SELECT json_build_object(
+                'op', 'I', 'ts', sent_at,
+                'rows', json_agg(json_build_array(id, status_id, user_id))
+            )::text
+            FROM (
+                SELECT id, status_id, user_id,
+                       (row_number() OVER () - 1) / 200 AS chunk
+                FROM new_rows
+            ) r
+            GROUP BY chunk
+        LOOP
+            PERFORM pg_notify('task_changes', payload);
+        END LOOP;
+    ELSIF TG_OP = 'UPDATE' THEN
+        FOR payload IN
+            SELECT json_build_object(
+                'op', 'U', 'ts', sent_at,
+                'rows', json_agg(json_build_array(id, old_status_id, new_status_id))
+            )::text
+            FROM (
+                SELECT n.id, o.status_id AS old_status_id, n.status_id AS new_status_id,
+                       (row_number() OVER () - 1) / 200 AS chunk
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id
+                WHERE o.status_id IS DISTINCT FROM n.status_id
+            ) r
+            GROUP BY chunk
+        LOOP
+            PERFORM pg_notify('task_changes', payload);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables дозволені лише для однієї події на тригер
+-- і не сумісні зі списком колонок (UPDATE OF status_id),
+-- тому зміна статусу перевіряється всередині функції.
+CREATE TRIGGER tasks_notify_insert
+    AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_task_changes();
+
+CREATE TRIGGER tasks_notify_update
+    AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_task_changes();
+
+COMMIT;
@@ -0,0 +1,137 @@
+BEGIN;
+
+-- Варіант схеми, у якому таблиця tasks секціонована за діапазоном created_at.
+-- Використовується замість schema.sql для великих обсягів даних:
+-- запити з умовою за created_at читають лише потрібні секції (partition pruning),
+-- а старі дані можна видаляти через DETACH/DROP секції замість DELETE.
+
+-- Видалення таблиць, якщо вони вже існують.
+DROP TABLE IF EXISTS tasks CASCADE;
+DROP TABLE IF EXISTS status CASCADE;
+DROP TABLE IF EXISTS users CASCADE;
+
+-- Створення таблиці користувачів (users).
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,              -- Унікальний ідентифікатор користувача (автоінкремент).
+    fullname VARCHAR(100) NOT NULL,     -- Повне ім'я користувача (обов'язкове поле).
+    email VARCHAR(100) UNIQUE NOT NULL  -- Унікальна електронна адреса (обов'язково).
+);
+
+-- Створення таблиці статусів (status).
+CREATE TABLE status (
+    id SERIAL PRIMARY KEY,           -- Унікальний ідентифікатор статусу (автоінкремент).
+    name VARCHAR(50) UNIQUE NOT NULL -- Унікальна назва статусу (обов'язково).
+);
+
+-- Створення секціонованої таблиці завдань (tasks).
+-- Первинний ключ секціонованої таблиці має містити ключ секціонування,
+-- тому він складений: (id, created_at).
+CREATE TABLE tasks (
+    id SERIAL,                       -- Ідентифікатор завдання (автоінкремент).
+    title VARCHAR(100) NOT NULL,     -- Назва завдання (обов'язково).
+    description TEXT,                -- Опис завдання (опційно).
+    status_id INTEGER NOT NULL REFERENCES status (id),
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Індекси на батьківській таблиці автоматично створюються в кожній секції.
+CREATE INDEX tasks_user_id_idx ON tasks (user_id);
+CREATE INDEX tasks_status_id_idx ON tasks (status_id);
+
+-- Секція за замовчуванням для рядків поза створеними діапазонами.
+CREATE TABLE tasks_default PARTITION OF tasks DEFAULT;
+
+-- Створює щомісячні секції tasks_YYYY_MM від (поточний місяць - months_back)
+-- до (поточний місяць + months_ahead) включно. Ідемпотентна: наявні секції пропускаються.
+-- Викликається seed.py перед заповненням і за розкладом (див. pg_cron нижче),
+-- щоб секції на майбутні місяці існували заздалегідь.
+-- Якщо рядки місяця вже потрапили в tasks_default, PostgreSQL не дозволяє
+-- створити секцію напряму, тому секція створюється окремою таблицею,
+-- рядки переносяться з tasks_default і таблиця приєднується через ATTACH.
+-- Прямі DML над секціями не запускають statement-тригери tasks
+-- (schema_aggregates.sql, schema_notify.sql), тож перенесення не змінює лічильники.
+-- Кожен місяць обробляється у власній субтранзакції: помилка одного місяця
+-- записується як WARNING і не зупиняє створення наступних секцій.
+CREATE OR REPLACE FUNCTION ensure_tasks_partitions(
+    months_back INTEGER DEFAULT 0,
+    months_ahead INTEGER DEFAULT 3
+) RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+    moved_rows BIGINT;
+    created INTEGER := 0;
+BEGIN
+    FOR i IN -months_back..months_ahead LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE;
+        month_end := (month_start + INTERVAL '1 month')::DATE;
+        partition_name := format('tasks_%s', to_char(month_start, 'YYYY_MM'));
+
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        BEGIN
+            -- Нові рядки місяця не потраплять у tasks_default під час перенесення
+            LOCK TABLE tasks_default IN EXCLUSIVE MODE;
+
+            IF EXISTS (
+                SELECT 1 FROM tasks_default
+                WHERE created_at >= month_start AND created_at < month_end
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE tasks INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                    partition_name
+                );
+                EXECUTE format(
+                    'WITH moved AS (
+                         DELETE FROM tasks_default
+                         WHERE created_at >= %L AND created_at < %L
+                         RETURNING *
+                     )
+                     INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, partition_name
+                );
+                GET DIAGNOSTICS moved_rows = ROW_COUNT;
+                EXECUTE format(
+                    'ALTER TABLE tasks ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end
+                );
+                RAISE NOTICE 'Секцію % створено, перенесено % рядків з tasks_default',
+                    partition_name, moved_rows;
+            ELSE
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF tasks FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end
+                );
+            END IF;
+            created := created + 1;
+        EXCEPTION WHEN OTHERS THEN
+            RAISE WARNING 'Секцію % не створено: %', partition_name, SQLERRM;
+        END;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Початковий набір секцій: рік назад і три місяці вперед.
+SELECT ensure_tasks_partitions(12, 3);
+
+-- Щоденне створення майбутніх секцій через pg_cron, якщо розширення встановлене
+-- (задача з тим самим ім'ям оновлюється, тож блок можна виконувати повторно).
+-- Без pg_cron — запис системного cron, наприклад:
+--   0 3 * * * psql "$DATABASE_URL" -c "SELECT ensure_tasks_partitions(0, 3)"
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'ensure_tasks_partitions',
+            '0 3 * * *',
+            'SELECT ensure_tasks_partitions(0, 3)'
+        );
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,22 @@
+BEGIN;
+
+-- Опційне розширення схеми: повнотекстовий пошук по tasks.
+-- Застосовується після schema.sql (або schema_partitioned.sql).
+-- Згенерована колонка search_vector поєднує title (вага A) та description (вага B)
+-- і підтримується PostgreSQL автоматично при INSERT/UPDATE.
+-- Використовується конфігурація 'simple': стандартна поставка PostgreSQL
+-- не містить словника для української мови, тож слова лише нормалізуються
+-- до нижнього регістру без стемінгу.
+
+ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector;
+
+ALTER TABLE tasks ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED;
+
+-- GIN індекс для оператора @@ (замість повного сканування з LIKE).
+CREATE INDEX tasks_search_vector_idx ON tasks USING GIN (search_vector);
+
+COMMIT;
@@ -1,17 +1,66 @@
+import argparse
 import logging
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 import psycopg2
-from config import DB_CONFIG, FILE_CONFIG, LOG_CONFIG
-from faker import Faker
+from config import DB_CONFIG, LOG_CONFIG
+from psycopg2.extras import execute_values
 
-# Налаштування логування
-logging.basicConfig(**LOG_CONFIG)
 logger = logging.getLogger(__name__)
 
-# Ініціалізація Faker
-faker = Faker("uk_UA")
+# Предметна лексика для назв завдань: дає реалістичну вибірковість
+# повнотекстового пошуку (schema_search.sql, requests_search.sql)
+TASK_VOCABULARY = [
+    "звіт",
+    "проєкт",
+    "план",
+    "робіт",
+    "зустріч",
+    "клієнт",
+    "бюджет",
+    "договір",
+    "презентація",
+    "аналіз",
+    "перевірка",
+    "реліз",
+    "тестування",
+    "документація",
+    "оновлення",
+    "міграція",
+    "дизайн",
+    "рахунок",
+    "підтримка",
+    "навчання",
+    "інтеграція",
+    "аудит",
+    "закупівля",
+    "резервна",
+    "копія",
+    "сервер",
+    "база",
+    "даних",
+    "команда",
+    "квартал",
+    "маркетинг",
+    "продаж",
+    "доставка",
+    "склад",
+]
+
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Повертає екземпляр Faker, створюючи його під час першого виклику.
+    Імпорт faker та завантаження локалі займають помітний час, тому
+    відкладаються до моменту, коли дані справді потрібні.
+    :return: об'єкт Faker з локаллю uk_UA
+    """
+    from faker import Faker
+
+    return Faker("uk_UA")
 
 
 def create_connection():
@@ -57,6 +106,7 @@ def seed_users(conn, count=10):
     :param conn: об'єкт з'єднання до бази даних
     :param count: кількість користувачів для створення
     """
+    faker = get_faker()
     users = [(faker.name(), faker.unique.email()) for _ in range(count)]
     try:
         with conn.cursor() as cursor:
@@ -74,12 +124,49 @@ def seed_users(conn, count=10):
         conn.rollback()
 
 
-def seed_tasks(conn, count=50):
+def ensure_partitions(conn, spread_days=0, months_ahead=3):
+    """
+    Створює щомісячні секції tasks, що покривають діапазон дат для заповнення.
+    Потребує схеми schema_partitioned.sql (функції ensure_tasks_partitions).
+    :param conn: об'єкт з'єднання до бази даних
+    :param spread_days: на скільки днів у минуле розподіляється created_at
+    :param months_ahead: скільки майбутніх місяців підготувати заздалегідь
+    """
+    months_back = spread_days // 28 + 1 if spread_days else 0
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT ensure_tasks_partitions(%s, %s)", (months_back, months_ahead)
+            )
+            created = cursor.fetchone()[0]
+            conn.commit()
+            logger.info(f"Створено {created} нових секцій таблиці 'tasks'.")
+    except psycopg2.Error as e:
+        logger.error(f"Помилка при створенні секцій таблиці 'tasks': {e}")
+        conn.rollback()
+
+
+def random_created_at(spread_days):
+    """
+    Повертає випадкову мітку часу в межах останніх spread_days днів.
+    :param spread_days: ширина діапазону в днях
+    :return: datetime
+    """
+    offset = random.uniform(0, spread_days * 86400)
+    return datetime.now() - timedelta(seconds=offset)
+
+
+def seed_tasks(conn, count=50, spread_days=0, batch_size=1000, text_chars=200):
     """
     Заповнює таблицю tasks випадковими даними.
     :param conn: об'єкт з'єднання до бази даних
     :param count: кількість завдань для створення
+    :param spread_days: якщо більше 0, created_at рівномірно розподіляється
+                        на останні spread_days днів
+    :param batch_size: кількість рядків в одному INSERT
+    :param text_chars: максимальна довжина опису завдання
     """
+    faker = get_faker()
     try:
         with conn.cursor() as cursor:
             cursor.execute(
@@ -94,23 +181,32 @@ def seed_tasks(conn, count=50):
                 logger.warning("Немає даних для створення завдань")
                 return
 
-            tasks = [
-                (
-                    faker.sentence(nb_words=4),
-                    faker.text(max_nb_chars=200),
-                    random.choice([s_id for _, s_id in combinations]),
-                    random.choice([u_id for u_id, _ in combinations]),
-                )
-                for _ in range(count)
-            ]
+            status_ids = [s_id for _, s_id in combinations]
+            user_ids = [u_id for u_id, _ in combinations]
 
-            cursor.executemany(
-                """
-                INSERT INTO tasks (title, description, status_id, user_id)
-                VALUES (%s, %s, %s, %s)
-                """,
-                tasks,
-            )
+            for offset in range(0, count, batch_size):
+                size = min(batch_size, count - offset)
+                tasks = [
+                    (
+                        faker.sentence(nb_words=4, ext_word_list=TASK_VOCABULARY),
+                        faker.text(max_nb_chars=text_chars),
+                        random.choice(status_ids),
+                        random.choice(user_ids),
+                        random_created_at(spread_days) if spread_days else None,
+                    )
+                    for _ in range(size)
+                ]
+
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO tasks (title, description, status_id, user_id, created_at)
+                    VALUES %s
+                    """,
+                    tasks,
+                    template="(%s, %s, %s, %s, COALESCE(%s, CURRENT_TIMESTAMP))",
+                    page_size=size,
+                )
 
             conn.commit()
             logger.info(f"Додано {count} завдань успішно")
@@ -120,16 +216,55 @@ def seed_tasks(conn, count=50):
         conn.rollback()
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Розбирає аргументи командного рядка.
+    :param argv: список аргументів (за замовчуванням sys.argv)
+    :return: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Заповнення бази task_management")
+    parser.add_argument("--users", type=int, default=10, help="кількість користувачів")
+    parser.add_argument("--tasks", type=int, default=50, help="кількість завдань")
+    parser.add_argument(
+        "--spread-days",
+        type=int,
+        default=0,
+        help="розподілити created_at на останні N днів",
+    )
+    parser.add_argument(
+        "--text-chars",
+        type=int,
+        default=200,
+        help="максимальна довжина опису завдання (для тестів повнотекстового пошуку)",
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="схема schema_partitioned.sql: створити секції перед заповненням",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Основна функція для запуску скрипта.
     """
+    args = parse_args(argv)
+    logging.basicConfig(**LOG_CONFIG)
+
     conn = create_connection()
     if conn:
         try:
+            if args.partitioned:
+                ensure_partitions(conn, spread_days=args.spread_days)
             seed_statuses(conn)
-            seed_users(conn, count=10)
-            seed_tasks(conn, count=50)
+            seed_users(conn, count=args.users)
+            seed_tasks(
+                conn,
+                count=args.tasks,
+                spread_days=args.spread_days,
+                text_chars=args.text_chars,
+            )
         finally:
             conn.close()
             logger.info("З'єднання з базою даних закрито.")
@@ -0,0 +1,175 @@
+"""
+Серверна статистика виконання запитів (pg_stat_statements, pg_stat*_user_tables).
+
+Знімки читаються окремим з'єднанням в режимі autocommit, щоб не впливати
+на транзакцію блоку. pg_stat_statements оновлюється після завершення кожної
+інструкції, тому різниця знімків до та після блоку точно описує сам блок:
+кількість викликів, середній/максимальний час, рядки, shared blocks hit/read.
+
+Лічильники таблиць (seq_scan, idx_scan, heap/idx blocks) PostgreSQL публікує
+із затримкою після COMMIT, тому вони порівнюються на рівні всього запуску.
+
+Потрібне розширення pg_stat_statements:
+    shared_preload_libraries = 'pg_stat_statements'  (postgresql.conf)
+    CREATE EXTENSION pg_stat_statements;
+"""
+
+import logging
+from typing import Dict, Optional
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_COUNTERS = ("calls", "rows", "shared_blks_hit", "shared_blks_read")
+
+TABLE_STATS_QUERY = """
+SELECT t.relname, t.seq_scan, t.seq_tup_read,
+       COALESCE(t.idx_scan, 0), COALESCE(t.idx_tup_fetch, 0),
+       t.n_tup_ins, t.n_tup_upd, t.n_tup_del,
+       COALESCE(io.heap_blks_read, 0), COALESCE(io.heap_blks_hit, 0),
+       COALESCE(io.idx_blks_read, 0), COALESCE(io.idx_blks_hit, 0)
+FROM pg_stat_user_tables t
+JOIN pg_statio_user_tables io ON io.relid = t.relid
+"""
+
+TABLE_COUNTERS = (
+    "seq_scan",
+    "seq_tup_read",
+    "idx_scan",
+    "idx_tup_fetch",
+    "n_tup_ins",
+    "n_tup_upd",
+    "n_tup_del",
+    "heap_blks_read",
+    "heap_blks_hit",
+    "idx_blks_read",
+    "idx_blks_hit",
+)
+
+
+class ServerStats:
+    """Знімки та різниці серверної статистики для поточної бази даних"""
+
+    def __init__(self, dsn_params: Dict):
+        self.conn = psycopg2.connect(**dsn_params)
+        self.conn.autocommit = True
+        try:
+            self.time_columns = self._detect_time_columns()
+        except psycopg2.Error:
+            self.conn.close()
+            raise
+
+    def _detect_time_columns(self) -> tuple:
+        """PostgreSQL 13+ використовує *_exec_time, старіші версії — *_time"""
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT * FROM pg_stat_statements LIMIT 0")
+            columns = {column.name for column in cur.description}
+        if "total_exec_time" in columns:
+            return "total_exec_time", "max_exec_time"
+        return "total_time", "max_time"
+
+    @classmethod
+    def connect(cls, dsn_params: Dict) -> Optional["ServerStats"]:
+        """Повертає ServerStats або None, якщо pg_stat_statements недоступне"""
+        try:
+            return cls(dsn_params)
+        except psycopg2.Error as e:
+            logger.warning(f"pg_stat_statements недоступне, статистику вимкнено: {e}")
+            return None
+
+    def snapshot_statements(self) -> Dict[tuple, Dict]:
+        """Знімок pg_stat_statements поточної бази: (userid, queryid) -> лічильники"""
+        total_column, max_column = self.time_columns
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT userid, queryid, query, calls, {total_column}, {max_column},
+                       rows, shared_blks_hit, shared_blks_read
+                FROM pg_stat_statements
+                WHERE dbid = (SELECT oid FROM pg_database
+                              WHERE datname = current_database())
+                  AND query NOT ILIKE '%pg_stat_statements%'
+                """
+            )
+            return {
+                (row[0], row[1]): {
+                    "query": row[2],
+                    "calls": row[3],
+                    "total_time_ms": row[4],
+                    "max_time_ms": row[5],
+                    "rows": row[6],
+                    "shared_blks_hit": row[7],
+                    "shared_blks_read": row[8],
+                }
+                for row in cur.fetchall()
+            }
+
+    def snapshot_tables(self) -> Dict[str, Dict]:
+        """Знімок лічильників сканувань та блоків для таблиць користувача"""
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT pg_stat_clear_snapshot()")
+            cur.execute(TABLE_STATS_QUERY)
+            return {
+                row[0]: dict(zip(TABLE_COUNTERS, row[1:])) for row in cur.fetchall()
+            }
+
+    @staticmethod
+    def diff_statements(before: Dict[tuple, Dict], after: Dict[tuple, Dict]) -> Dict:
+        """Різниця знімків pg_stat_statements: підсумок та список інструкцій"""
+        statements = []
+        for key, stats in after.items():
+            previous = before.get(key, {})
+            calls = stats["calls"] - previous.get("calls", 0)
+            if calls <= 0:
+                continue
+            delta = {
+                counter: stats[counter] - previous.get(counter, 0)
+                for counter in STATEMENT_COUNTERS
+            }
+            total_time = stats["total_time_ms"] - previous.get("total_time_ms", 0)
+            delta.update(
+                {
+                    "query": stats["query"],
+                    "total_time_ms": round(total_time, 3),
+                    "mean_time_ms": round(total_time / calls, 3),
+                    # pg_stat_statements зберігає лише максимум за весь час
+                    "max_time_ms": round(stats["max_time_ms"], 3),
+                }
+            )
+            statements.append(delta)
+
+        statements.sort(key=lambda s: s["total_time_ms"], reverse=True)
+        summary = {
+            counter: sum(s[counter] for s in statements)
+            for counter in STATEMENT_COUNTERS
+        }
+        total_time = sum(s["total_time_ms"] for s in statements)
+        summary.update(
+            {
+                "total_time_ms": round(total_time, 3),
+                "mean_time_ms": (
+                    round(total_time / summary["calls"], 3) if summary["calls"] else 0
+                ),
+                "max_time_ms": max((s["max_time_ms"] for s in statements), default=0),
+                "statements": statements,
+            }
+        )
+        return summary
+
+    @staticmethod
+    def diff_tables(before: Dict[str, Dict], after: Dict[str, Dict]) -> Dict:
+        """Різниця лічильників таблиць; таблиці без змін не включаються"""
+        result = {}
+        for table, stats in after.items():
+            previous = before.get(table, {})
+            delta = {
+                counter: stats[counter] - previous.get(counter, 0)
+                for counter in TABLE_COUNTERS
+            }
+            if any(delta.values()):
+                result[table] = delta
+        return result
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,165 @@
+"""
+Слухач стрічки змін tasks (LISTEN task_changes, див. schema_notify.sql).
+
+З'єднання працює в режимі autocommit і чекає на повідомлення через select()
+без активних запитів до бази: connection.poll() лише зчитує вже отримані
+з сокета повідомлення. Зміни групуються в пакети: пакет передається
+обробнику, щойно набирається max_batch змін або минає max_wait секунд
+з моменту отримання першої зміни пакета.
+
+Приклад запуску:
+    python task_feed.py --max-batch 500 --max-wait 0.05
+"""
+
+import argparse
+import json
+import logging
+import select
+import time
+from typing import Callable, Dict, List, Optional
+
+import psycopg2
+from config import DB_CONFIG, LOG_CONFIG
+from psycopg2 import sql
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "task_changes"
+
+# Назви полів рядка повідомлення для кожного типу операції
+ROW_FIELDS = {
+    "I": ("id", "status_id", "user_id"),
+    "U": ("id", "old_status_id", "status_id"),
+}
+
+
+def parse_payload(payload: str, received_at: float) -> List[Dict]:
+    """Розгортає JSON повідомлення тригера у список змін"""
+    message = json.loads(payload)
+    fields = ROW_FIELDS[message["op"]]
+    return [
+        dict(
+            zip(fields, row),
+            op=message["op"],
+            sent_at=message["ts"],
+            received_at=received_at,
+        )
+        for row in message["rows"]
+    ]
+
+
+class TaskChangeListener:
+    """Неблокуючий слухач каналу змін tasks з пакетною обробкою"""
+
+    def __init__(
+        self,
+        dsn_params: Dict,
+        channel: str = CHANNEL,
+        max_batch: int = 500,
+        max_wait: float = 0.05,
+    ):
+        self.channel = channel
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.conn = psycopg2.connect(**dsn_params)
+        self.conn.autocommit = True
+        self._pending: List[Dict] = []
+        self._first_at: Optional[float] = None
+        with self.conn.cursor() as cur:
+            cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+
+    def fileno(self) -> int:
+        return self.conn.fileno()
+
+    def _drain(self) -> None:
+        """Зчитує отримані повідомлення з сокета без запитів до сервера"""
+        self.conn.poll()
+        received_at = time.time()
+        while self.conn.notifies:
+            notify = self.conn.notifies.pop(0)
+            try:
+                changes = parse_payload(notify.payload, received_at)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Некоректне повідомлення {notify.payload!r}: {e}")
+                continue
+            if not self._pending:
+                self._first_at = time.monotonic()
+            self._pending.extend(changes)
+
+    def _take_batch(self) -> List[Dict]:
+        batch, self._pending = self._pending, []
+        self._first_at = None
+        return batch
+
+    def poll_batch(self, timeout: Optional[float] = None) -> List[Dict]:
+        """Чекає наступний пакет змін не довше timeout секунд (None — без обмеження)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if len(self._pending) >= self.max_batch:
+                return self._take_batch()
+
+            now = time.monotonic()
+            waits = []
+            if self._first_at is not None:
+                waits.append(self._first_at + self.max_wait - now)
+            if deadline is not None:
+                waits.append(deadline - now)
+            wait = max(min(waits), 0) if waits else None
+
+            if wait == 0:
+                return self._take_batch()
+            if select.select([self], [], [], wait)[0]:
+                self._drain()
+
+    def listen(
+        self,
+        handler: Callable[[List[Dict]], None],
+        stop: Callable[[], bool] = lambda: False,
+        timeout: float = 1.0,
+    ) -> None:
+        """Передає пакети змін обробнику, доки stop() не поверне True"""
+        while not stop():
+            batch = self.poll_batch(timeout)
+            if batch:
+                handler(batch)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def print_batch(batch: List[Dict]) -> None:
+    """Стандартний обробник: підсумок пакета та середня затримка доставки"""
+    inserted = sum(1 for change in batch if change["op"] == "I")
+    latency = sum(c["received_at"] - c["sent_at"] for c in batch) / len(batch)
+    print(
+        f"Пакет: {len(batch)} змін (нових {inserted}, "
+        f"змін статусу {len(batch) - inserted}), "
+        f"затримка {latency * 1000:.1f} мс",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Слухач стрічки змін tasks")
+    parser.add_argument("--channel", default=CHANNEL)
+    parser.add_argument("--max-batch", type=int, default=500)
+    parser.add_argument(
+        "--max-wait", type=float, default=0.05, help="макс. очікування пакета, с"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(**LOG_CONFIG)
+    listener = TaskChangeListener(
+        DB_CONFIG, args.channel, args.max_batch, args.max_wait
+    )
+    print(f"Очікування змін на каналі {args.channel} (Ctrl+C для виходу)")
+    try:
+        listener.listen(print_batch)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Тести колонкового експорту (columnar_export) на імітації іменованого курсора.
+
+Тести parquet/arrow пропускаються, якщо pyarrow не встановлено.
+
+Запуск:
+    python -m pytest -q test_columnar_export.py
+"""
+
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from columnar_export import ColumnarExporter
+
+Column = namedtuple("Column", "name type_code precision scale")
+
+DESCRIPTION = [
+    Column("id", 23, None, None),
+    Column("note", 0, None, None),  # тип без відповідника Arrow
+    Column("total", 1700, None, None),  # numeric без точності
+    Column("price", 1700, 6, 2),  # numeric(6, 2)
+    Column("day", 1082, None, None),
+]
+
+ROWS = [
+    (1, None, None, None, None),
+    (2, None, None, None, None),
+    (3, {"tags": ["a"]}, Decimal("12345678901234567890.5"), Decimal("10.50"), None),
+    (4, 42, Decimal("1"), None, date(2025, 1, 31)),
+]
+
+
+class FakeCursor:
+    def __init__(self, rows, description):
+        self.rows = list(rows)
+        self.description = description
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        pass
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class FakeConnection:
+    def __init__(self, rows, description=DESCRIPTION):
+        self.rows = rows
+        self.description = description
+
+    def cursor(self, name=None):
+        return FakeCursor(self.rows, self.description)
+
+
+def read_table(pa, output_format, path):
+    if output_format == "parquet":
+        return pa.parquet.read_table(str(path))
+    return pa.ipc.open_file(str(path)).read_all()
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+def test_null_only_first_batch(tmp_path, output_format):
+    pa = pytest.importorskip("pyarrow")
+    exporter = ColumnarExporter(output_format, tmp_path, batch_size=2)
+    rows, path = exporter.export(FakeConnection(ROWS), "SELECT ...")
+    assert rows == 4
+
+    table = read_table(pa, output_format, path)
+    assert [field.type for field in table.schema] == [
+        pa.int32(),
+        pa.string(),
+        pa.string(),
+        pa.decimal128(6, 2),
+        pa.date32(),
+    ]
+    assert table.to_pydict() == {
+        "id": [1, 2, 3, 4],
+        "note": [None, None, '{"tags": ["a"]}', "42"],
+        "total": [None, None, "12345678901234567890.5", "1"],
+        "price": [None, None, Decimal("10.50"), None],
+        "day": [None, None, None, date(2025, 1, 31)],
+    }
+
+
+def test_empty_result_keeps_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    exporter = ColumnarExporter("arrow", tmp_path)
+    rows, path = exporter.export(FakeConnection([]), "SELECT ...")
+    assert rows == 0
+    assert read_table(pa, "arrow", path).schema.names == [
+        column.name for column in DESCRIPTION
+    ]
+
+
+def test_csv_export(tmp_path):
+    exporter = ColumnarExporter("csv", tmp_path, batch_size=3)
+    rows, path = exporter.export(FakeConnection(ROWS[:2]), "SELECT ...")
+    assert rows == 2
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "id,note,total,price,day",
+        "1,,,,",
+        "2,,,,",
+    ]
@@ -0,0 +1,60 @@
+"""
+Тести об'єднання результатів кількох цілей (fanout.merge_plan, merge_rows).
+
+Запуск:
+    python -m pytest -q test_fanout.py
+"""
+
+from decimal import Decimal
+
+import pytest
+from fanout import merge_plan, merge_rows
+
+
+@pytest.mark.parametrize(
+    "query, plan",
+    [
+        ("SELECT COUNT(*) FROM tasks", ["COUNT"]),
+        (
+            "SELECT status_id, COUNT(*) AS n, SUM(estimate) FROM tasks "
+            "GROUP BY status_id",
+            [None, "COUNT", "SUM"],
+        ),
+        ("SELECT MIN(created_at), MAX(created_at) FROM tasks", ["MIN", "MAX"]),
+    ],
+)
+def test_merge_plan(query, plan):
+    assert merge_plan(query) == plan
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT COUNT(DISTINCT user_id) FROM tasks",
+        "SELECT status_id, count( distinct user_id ) AS users FROM tasks "
+        "GROUP BY status_id",
+        "SELECT SUM(DISTINCT estimate) FROM tasks",
+        "SELECT AVG(estimate) FROM tasks",
+        "SELECT DISTINCT status_id FROM tasks",
+        "SELECT * FROM tasks",
+        "SELECT id, title FROM tasks",
+    ],
+)
+def test_merge_plan_refuses_non_combinable(query):
+    assert merge_plan(query) is None
+
+
+def test_merge_rows_groups_and_combines():
+    plan = [None, "COUNT", "SUM", "MIN"]
+    rows = merge_rows(
+        plan,
+        [
+            [(1, 2, Decimal("1.50"), 3), (2, 1, None, 7)],
+            [(1, 3, Decimal("0.25"), 1), (3, 4, Decimal("2"), None)],
+        ],
+    )
+    assert sorted(rows) == [
+        (1, 5, Decimal("1.75"), 1),
+        (2, 1, None, 7),
+        (3, 4, Decimal("2"), None),
+    ]
@@ -0,0 +1,47 @@
+"""
+Тести кодування результатів запитів у JSON (result_encoder).
+
+Запуск:
+    python -m pytest -q test_result_encoder.py
+"""
+
+import json
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from result_encoder import ResultSerializer, encode_rows, encode_value
+
+Column = namedtuple("Column", "name type_code")
+
+NUMERIC = 1700
+NUMERIC_ARRAY = 1231
+
+
+def test_numeric_column_keeps_one_type_and_scale():
+    rows = [(Decimal("2.00"),), (Decimal("2.50"),), (Decimal("NaN"),), (None,)]
+    encoded = encode_rows(rows, [Column("amount", NUMERIC)])
+    assert encoded == [["2.00"], ["2.50"], ["NaN"], [None]]
+
+
+def test_numeric_array_elements_are_strings():
+    rows = [([Decimal("1"), None, Decimal("1.10")],)]
+    encoded = encode_rows(rows, [Column("amounts", NUMERIC_ARRAY)])
+    assert encoded == [[["1", None, "1.10"]]]
+
+
+def test_unknown_column_uses_type_encoders():
+    rows = [(date(2025, 1, 31), Decimal("3.0"))]
+    encoded = encode_rows(rows, [Column("day", 0), Column("value", 0)])
+    assert encoded == [["2025-01-31", "3.0"]]
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_serializer_encodes_raw_decimals_as_strings(backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    report = {"result": [(Decimal("10"), Decimal("0.30"))]}
+    assert encode_value(Decimal("10")) == "10"
+    serializer = ResultSerializer(backend, compact=True)
+    assert json.loads(serializer.dumps(report)) == {"result": [["10", "0.30"]]}
@@ -0,0 +1,66 @@
+"""
+Порівняння сховищ MongoDB та MemoryCollection на однаковому навантаженні.
+
+Обидва сховища проганяються через ті самі функції cats_manager
+(load_generator.LoadGenerator у закритому режимі), тому різниця в результатах
+показує вартість мережі та серверної обробки MongoDB.
+
+Приклад запуску:
+    python bench_backends.py --duration 10 --workers 4 --keys 10000
+"""
+
+import argparse
+import json
+
+from config import MONGO_URI, setup_logging
+from db_connection import get_db_connection
+from load_generator import DEFAULT_MIX, LoadGenerator, build_report
+from memory_backend import MemoryCollection
+
+
+def run_backend(collection, args) -> list[dict]:
+    """Виконує навантаження на колекції та повертає підсумок за операціями"""
+    generator = LoadGenerator(collection, args.mix, args.keys, args.skew)
+    generator.preload(args.keys)
+    generator.run_closed(args.workers, args.duration)
+    elapsed = max((sample[0] for sample in generator.samples), default=0) + 1e-9
+    return build_report(generator.samples, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння сховищ котів")
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--skew", type=float, default=0.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--uri", default=MONGO_URI)
+    parser.add_argument("--database", default="cats_load")
+    parser.add_argument(
+        "--skip-mongo", action="store_true", help="лише сховище в пам'яті"
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    report = {"memory": run_backend(MemoryCollection(), args)}
+    if not args.skip_mongo:
+        collection = get_db_connection(args.uri, args.database, "cats")
+        collection.create_index("name")
+        report["mongo"] = run_backend(collection, args)
+
+    summary = {
+        backend: {
+            row["operation"]: {
+                "throughput_ops_s": row["throughput_ops_s"],
+                "p50_ms": row["p50_ms"],
+                "p99_ms": row["p99_ms"],
+            }
+            for row in rows
+        }
+        for backend, rows in report.items()
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Бенчмарк масштабування читань у replica set за різних READ_PREFERENCE.
+
+Для кожного режиму читання проганяє однакове навантаження з переважанням
+читань (load_generator.LoadGenerator у закритому режимі) і звітує
+пропускну здатність, p50/p99 затримки та розподіл операцій між членами
+replica set (різниця opcounters з serverStatus кожного члена).
+
+Приклад запуску (після python replica_set.py start):
+    python bench_reads.py --modes primary,secondaryPreferred,nearest \\
+        --workers 16 --duration 10 --read-your-writes
+"""
+
+import argparse
+import json
+
+from config import READ_PREFERENCES, setup_logging
+from db_connection import RoutedCollection, get_db_connection
+from load_generator import LoadGenerator, build_report
+from pymongo import MongoClient
+from replica_set import replica_set_uri
+
+OPCOUNTERS = ("query", "getmore", "command", "insert", "update", "delete")
+
+
+def member_opcounters(uri: str) -> dict:
+    """opcounters кожного члена replica set: {host: {лічильник: значення}}"""
+    counters = {}
+    with MongoClient(uri, serverSelectionTimeoutMS=5000) as client:
+        hosts = client.admin.command("hello")["hosts"]
+    for host in hosts:
+        with MongoClient(f"mongodb://{host}/?directConnection=true") as member:
+            status = member.admin.command("serverStatus")
+            counters[host] = {key: status["opcounters"][key] for key in OPCOUNTERS}
+    return counters
+
+
+def run_mode(mode: str, args) -> dict:
+    collection = get_db_connection(
+        args.uri,
+        args.database,
+        "cats",
+        read_preference=mode,
+        max_staleness=args.max_staleness if mode != "primary" else -1,
+        read_your_writes=args.read_your_writes,
+    )
+    collection.create_index("name")
+
+    generator = LoadGenerator(collection, args.mix, args.keys, args.skew)
+    generator.preload(args.keys)
+
+    before = member_opcounters(args.uri)
+    generator.run_closed(args.workers, args.duration)
+    after = member_opcounters(args.uri)
+    if isinstance(collection, RoutedCollection):
+        collection.close()
+
+    elapsed = max((sample[0] for sample in generator.samples), default=0) + 1e-9
+    return {
+        "operations": {
+            row["operation"]: {
+                "throughput_ops_s": row["throughput_ops_s"],
+                "p50_ms": row["p50_ms"],
+                "p99_ms": row["p99_ms"],
+            }
+            for row in build_report(generator.samples, elapsed)
+        },
+        "members": {
+            host: {
+                key: after[host][key] - before.get(host, {}).get(key, 0)
+                for key in OPCOUNTERS
+            }
+            for host in after
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Масштабування читань у replica set")
+    parser.add_argument(
+        "--modes",
+        default="primary,secondaryPreferred,nearest",
+        help=f"режими через кому: {', '.join(READ_PREFERENCES)}",
+    )
+    parser.add_argument("--uri", default=replica_set_uri(27017))
+    parser.add_argument("--database", default="cats_load")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--skew", type=float, default=0.0)
+    parser.add_argument("--mix", default="find=95,update=5")
+    parser.add_argument("--max-staleness", type=int, default=90)
+    parser.add_argument(
+        "--read-your-writes", action="store_true", help="причинно-узгоджені сесії"
+    )
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    unknown = [mode for mode in modes if mode not in READ_PREFERENCES]
+    if unknown:
+        parser.error(f"Невідомі режими читання: {unknown}")
+
+    setup_logging()
+    report = {mode: run_mode(mode, args) for mode in modes}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+CLI пакетного видалення котів (функції з cats_bulk.py).
+
+Приклад запуску:
+    python bulk_delete.py --filter '{"age": {"$gt": 20}}' --pause 0.05
+    python bulk_delete.py --recreate
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from cats_bulk import delete_in_batches, recreate_collection
+from config import DELETE_BATCH_SIZE, setup_logging
+from db_connection import get_collection
+
+logger = logging.getLogger(__name__)
+
+
+def log_progress(deleted: int, elapsed: float) -> None:
+    """Стандартний звіт про прогрес: кількість та швидкість видалення"""
+    rate = deleted / elapsed if elapsed else 0
+    logger.info(f"Видалено {deleted} котів ({rate:.0f} док/с)")
+    print(f"Видалено {deleted} котів ({rate:.0f} док/с)", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетне видалення котів")
+    parser.add_argument("--filter", default="{}", help="фільтр MongoDB у форматі JSON")
+    parser.add_argument("--batch-size", type=int, default=DELETE_BATCH_SIZE)
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="пауза між пакетами, с"
+    )
+    parser.add_argument(
+        "--recreate",
+        action="store_true",
+        help="видалити всі документи через drop та відновлення індексів",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    collection = get_collection()
+    start = time.perf_counter()
+    if args.recreate:
+        deleted, error = recreate_collection(collection)
+    else:
+        deleted, error = delete_in_batches(
+            collection,
+            json.loads(args.filter),
+            args.batch_size,
+            args.pause,
+            progress=log_progress,
+        )
+
+    elapsed = time.perf_counter() - start
+    if error:
+        print(f"Помилка: {error}")
+    print(f"Всього видалено {deleted} котів за {elapsed:.3f} сек.")
+
+
+if __name__ == "__main__":
+    main()
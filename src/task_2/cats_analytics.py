@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from bisect import bisect_right
+
+from config import ANALYTICS_CACHE_TTL
+from memory_backend import MemoryCollection
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+# Межі корзин гістограми віку: [0, 2), [2, 5), ... [20, 31)
+AGE_BUCKETS = [0, 2, 5, 10, 15, 20, 31]
+
+
+class TTLCache:
+    """Невеликий потокобезпечний кеш результатів агрегацій з часом життя"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data = {}
+        # Покоління колекції збільшується при кожній інвалідації
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def generation(self, namespace) -> int:
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, generation: int) -> None:
+        """Кешує value, якщо колекцію не інвалідовано після початку обчислення"""
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, namespace) -> None:
+        """Видаляє всі записи колекції namespace"""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for key in [key for key in self._data if key[0] == namespace]:
+                del self._data[key]
+
+
+_cache = TTLCache(ANALYTICS_CACHE_TTL)
+
+
+def _namespace(collection):
+    return getattr(collection, "full_name", id(collection))
+
+
+def invalidate_analytics(collection) -> None:
+    """Скидає кеш аналітики колекції (викликається змінюючими функціями cats_manager)"""
+    _cache.invalidate(_namespace(collection))
+
+
+def _cached(collection, name: str, compute):
+    """Повертає (result, error) з кешу або обчислює та кешує результат"""
+    key = (_namespace(collection), name)
+    result = _cache.get(key)
+    if result is not None:
+        return result, None
+    generation = _cache.generation(key[0])
+    try:
+        result = compute()
+    except PyMongoError as e:
+        logger.error(f"Помилка агрегації '{name}': {e}")
+        return None, str(e)
+    _cache.set(key, result, generation)
+    return result, None
+
+
+def _in_memory(collection) -> bool:
+    """Сховище в пам'яті не виконує агрегацій — статистика рахується в процесі"""
+    return isinstance(collection, MemoryCollection)
+
+
+def ensure_analytics_indexes(collection) -> None:
+    """Створює індекси для аналітичних запитів"""
+    try:
+        # Покриваючий індекс для гістограми віку (IXSCAN без читання документів)
+        collection.create_index([("age", ASCENDING)], name="age_1")
+        # Мультиключовий індекс для пошуку котів без характеристик та $unwind
+        collection.create_index(
+            [("features", ASCENDING), ("age", ASCENDING)], name="features_1_age_1"
+        )
+    except PyMongoError as e:
+        logger.error(f"Помилка створення індексів аналітики: {e}")
+
+
+def age_histogram(collection, boundaries: list = AGE_BUCKETS):
+    """Гістограма віку котів ($bucket на сервері)"""
+
+    def compute_in_memory():
+        counts = {}
+        for cat in collection.find({}, {"age": 1}):
+            age = cat.get("age")
+            if age is None or age < boundaries[0]:
+                continue
+            index = bisect_right(boundaries, age) - 1
+            bucket = boundaries[index] if index < len(boundaries) - 1 else "інше"
+            counts[bucket] = counts.get(bucket, 0) + 1
+        # Порядок як у $bucket: корзини за зростанням межі, "інше" в кінці
+        order = [bucket for bucket in boundaries[:-1] if bucket in counts]
+        if "інше" in counts:
+            order.append("інше")
+        return [{"from": bucket, "count": counts[bucket]} for bucket in order]
+
+    def compute():
+        if _in_memory(collection):
+            return compute_in_memory()
+        pipeline = [
+            # $match і $project лише за полем age дозволяють покрити запит індексом
+            {"$match": {"age": {"$gte": boundaries[0]}}},
+            {"$project": {"_id": 0, "age": 1}},
+            {
+                "$bucket": {
+                    "groupBy": "$age",
+                    "boundaries": boundaries,
+                    "default": "інше",
+                    "output": {"count": {"$sum": 1}},
+                }
+            },
+        ]
+        return [
+            {"from": row["_id"], "count": row["count"]}
+            for row in collection.aggregate(pipeline)
+        ]
+
+    return _cached(collection, f"age_histogram:{boundaries}", compute)
+
+
+def average_age_by_feature(collection):
+    """Середній вік та кількість котів для кожної характеристики"""
+
+    def compute_in_memory():
+        groups = {}  # характеристика -> [сума віку, кількість з віком, кількість]
+        for cat in collection.find({}, {"age": 1, "features": 1}):
+            for feature in cat.get("features") or []:
+                group = groups.setdefault(feature, [0, 0, 0])
+                if isinstance(cat.get("age"), (int, float)):
+                    group[0] += cat["age"]
+                    group[1] += 1
+                group[2] += 1
+        rows = [
+            {
+                "feature": feature,
+                "average_age": round(total / aged, 2) if aged else None,
+                "count": count,
+            }
+            for feature, (total, aged, count) in groups.items()
+        ]
+        rows.sort(key=lambda row: (-row["count"], row["feature"]))
+        return rows
+
+    def compute():
+        if _in_memory(collection):
+            return compute_in_memory()
+        pipeline = [
+            {"$project": {"_id": 0, "age": 1, "features": 1}},
+            {"$unwind": "$features"},
+            {
+                "$group": {
+                    "_id": "$features",
+                    "average_age": {"$avg": "$age"},
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$sort": {"count": -1, "_id": 1}},
+        ]
+        # $avg повертає null, якщо в групі немає числового віку
+        return [
+            {
+                "feature": row["_id"],
+                "average_age": (
+                    round(row["average_age"], 2)
+                    if row["average_age"] is not None
+                    else None
+                ),
+                "count": row["count"],
+            }
+            for row in collection.aggregate(pipeline)
+        ]
+
+    return _cached(collection, "average_age_by_feature", compute)
+
+
+def count_cats_without_features(collection):
+    """Кількість котів без жодної характеристики"""
+
+    def compute():
+        # Порожній масив і відсутнє поле знаходяться через індекс features
+        return collection.count_documents({"features": {"$in": [None, []]}})
+
+    return _cached(collection, "count_without_features", compute)
@@ -0,0 +1,107 @@
+"""
+Пакетне видалення котів без довгих операцій над усією колекцією.
+
+delete_in_batches видаляє документи за фільтром діапазонами _id:
+кожен пакет — це пошук наступних batch_size значень _id (за індексом _id)
+та delete_many у межах [перший, останній] цього пакета, з паузою між пакетами.
+Для MemoryCollection пакети не потрібні: виконується один delete_many.
+recreate_collection — швидкий шлях для повного очищення: drop колекції
+та повторне створення її індексів.
+
+Використовується cats_manager.delete_all_cats та CLI bulk_delete.py.
+"""
+
+import logging
+import time
+
+from cats_analytics import invalidate_analytics
+from config import DELETE_BATCH_SIZE
+from db_connection import primary_collection
+from memory_backend import MemoryCollection
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+
+def delete_in_batches(
+    collection,
+    filter: dict | None = None,
+    batch_size: int = DELETE_BATCH_SIZE,
+    pause: float = 0.0,
+    progress=None,
+):
+    """Видаляє документи за фільтром пакетами за діапазонами _id"""
+    # Межі пакетів читаються з primary: відстала репліка пропустила б документи
+    collection = primary_collection(collection)
+    filter = filter or {}
+    deleted = 0
+    last_id = None
+    start = time.perf_counter()
+
+    try:
+        if isinstance(collection, MemoryCollection):
+            # Без сервера пакети лише додають повні перегляди записів
+            deleted = collection.delete_many(filter).deleted_count
+            if progress:
+                progress(deleted, time.perf_counter() - start)
+            return deleted, None
+
+        while True:
+            query = filter
+            if last_id is not None:
+                query = {"$and": [filter, {"_id": {"$gt": last_id}}]}
+            ids = [
+                doc["_id"]
+                for doc in collection.find(
+                    query, {"_id": 1}, sort=[("_id", 1)], limit=batch_size
+                )
+            ]
+            if not ids:
+                break
+
+            id_range = {"_id": {"$gte": ids[0], "$lte": ids[-1]}}
+            result = collection.delete_many(
+                {"$and": [filter, id_range]} if filter else id_range
+            )
+            deleted += result.deleted_count
+            last_id = ids[-1]
+
+            if progress:
+                progress(deleted, time.perf_counter() - start)
+            if len(ids) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+    except PyMongoError as e:
+        logger.error(f"Помилка пакетного видалення: {e}")
+        return deleted, str(e)
+    finally:
+        if deleted:
+            invalidate_analytics(collection)
+    return deleted, None
+
+
+def recreate_collection(collection):
+    """Швидке повне очищення: drop та відновлення індексів колекції"""
+    try:
+        count = collection.estimated_document_count()
+        indexes = [
+            (
+                info["key"],
+                {k: v for k, v in info.items() if k not in ("key", "v", "ns")},
+            )
+            for name, info in collection.index_information().items()
+            if name != "_id_"
+        ]
+        collection.drop()
+        for keys, options in indexes:
+            collection.create_index(keys, **options)
+        invalidate_analytics(collection)
+        logger.info(
+            f"Колекцію {collection.name} перестворено ({count} документів, "
+            f"{len(indexes)} індексів відновлено)"
+        )
+        return count, None
+    except PyMongoError as e:
+        logger.error(f"Помилка перестворення колекції: {e}")
+        return 0, str(e)
@@ -1,5 +1,8 @@
 import logging
 
+from cats_analytics import invalidate_analytics
+from cats_bulk import delete_in_batches
+from db_connection import primary_collection
 from pymongo.errors import PyMongoError
 from validators import validate_features, validate_name
 
@@ -56,7 +59,7 @@ def update_cat_age(collection, name: str, age: int):
     if not is_valid:
         return False, error
 
-    exists, error = validate_cat_exists(collection, name_value)
+    exists, error = validate_cat_exists(primary_collection(collection), name_value)
     if not exists:
         return False, error
 
@@ -66,6 +69,7 @@ def update_cat_age(collection, name: str, age: int):
             return False, f"Кота з ім'ям '{name_value}' не знайдено"
         if result.modified_count == 0:
             return False, "Вік не було оновлено (можливо, вказано той самий вік)"
+        invalidate_analytics(collection)
         return True, None
     except PyMongoError as e:
         logger.error(f"Помилка оновлення віку: {e}")
@@ -78,7 +82,7 @@ def add_feature_to_cat(collection, name: str, feature: str):
     if not is_valid:
         return False, error
 
-    exists, error = validate_cat_exists(collection, name_value)
+    exists, error = validate_cat_exists(primary_collection(collection), name_value)
     if not exists:
         return False, error
 
@@ -94,6 +98,7 @@ def add_feature_to_cat(collection, name: str, feature: str):
             return False, f"Кота з ім'ям '{name_value}' не знайдено"
         if result.modified_count == 0:
             return False, "Ця характеристика вже існує"
+        invalidate_analytics(collection)
         return True, None
     except PyMongoError as e:
         logger.error(f"Помилка додавання характеристики: {e}")
@@ -104,6 +109,8 @@ def delete_cat_by_name(collection, name: str):
     """Видаляє кота за ім'ям"""
     try:
         result = collection.delete_one({"name": name})
+        if result.deleted_count > 0:
+            invalidate_analytics(collection)
         return result.deleted_count > 0
     except PyMongoError as e:
         logger.error(f"Помилка видалення кота: {e}")
@@ -111,26 +118,26 @@ def delete_cat_by_name(collection, name: str):
 
 
 def delete_all_cats(collection):
-    """Видаляє всіх котів"""
-    try:
-        result = collection.delete_many({})
-        return result.deleted_count
-    except PyMongoError as e:
-        logger.error(f"Помилка видалення всіх котів: {e}")
-        return 0
+    """Видаляє всіх котів пакетами, щоб не тримати ресурси сервера довго"""
+    deleted, error = delete_in_batches(collection, {})
+    if error:
+        logger.error(f"Помилка видалення всіх котів: {error}")
+    return deleted
 
 
 def insert_cat(collection, name: str, age: int, features: list):
     """Додає нового кота"""
     try:
         # Check if cat with this name already exists
-        existing_cat = collection.find_one({"name": name})
+        # (на primary: відстала репліка пропустила б дублікат імені)
+        existing_cat = primary_collection(collection).find_one({"name": name})
         if existing_cat:
             logger.warning(f"Кіт з ім'ям '{name}' вже існує")
             return False, "Кіт з таким ім'ям вже існує"
 
         cat_doc = {"name": name, "age": age, "features": features}
         result = collection.insert_one(cat_doc)
+        invalidate_analytics(collection)
         return bool(result.inserted_id), None
     except PyMongoError as e:
         logger.error(f"Помилка додавання кота: {e}")
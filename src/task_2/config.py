@@ -4,10 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-from colorama import Fore, Style, init
-
-# Ініціалізація colorama
-init()
+from colorama import Fore, Style
 
 # Отримання шляху до директорії скрипта
 SCRIPT_DIR = Path(__file__).parent.absolute()
@@ -18,6 +15,35 @@ DATABASE_NAME = os.getenv("DATABASE_NAME", "cats_database")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "cats")
 MONGO_TIMEOUT = 5000  # мілісекунди
 
+# Маршрутизація читань у replica set (db_connection.RoutedCollection):
+# читання йдуть згідно з READ_PREFERENCE, записи — завжди на primary.
+# MAX_STALENESS_SECONDS: -1 — без обмеження, інакше не менше 90 (вимога MongoDB).
+# READ_YOUR_WRITES вмикає причинно-узгоджені сесії (causal consistency).
+READ_PREFERENCES = (
+    "primary",
+    "primaryPreferred",
+    "secondary",
+    "secondaryPreferred",
+    "nearest",
+)
+READ_PREFERENCE = os.getenv("READ_PREFERENCE", "primary")
+MAX_STALENESS_SECONDS = int(os.getenv("MAX_STALENESS_SECONDS", "-1"))
+READ_YOUR_WRITES = os.getenv("READ_YOUR_WRITES", "false").lower() in ("1", "true")
+
+# Розмір пакета для видалення котів (bulk_delete.delete_in_batches)
+DELETE_BATCH_SIZE = int(os.getenv("DELETE_BATCH_SIZE", "1000"))
+
+# Час життя кешу результатів агрегацій (cats_analytics), секунди
+ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "30"))
+
+# Сховище: "mongo" або "memory" (memory_backend.MemoryCollection)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "mongo")
+MEMORY_SNAPSHOT_FILE = os.getenv("MEMORY_SNAPSHOT_FILE", "")
+
+# Буфер відкладеного запису (write_buffer.CatWriteBuffer)
+WRITE_BUFFER_DELAY_MS = int(os.getenv("WRITE_BUFFER_DELAY_MS", "20"))
+WRITE_BUFFER_MAX_OPS = int(os.getenv("WRITE_BUFFER_MAX_OPS", "500"))
+
 # Custom log levels
 logging.SUCCESS = 25  # Between INFO and WARNING
 logging.addLevelName(logging.SUCCESS, "SUCCESS")
@@ -73,6 +99,7 @@ MENU_OPTIONS = {
     "5": ("Видалити кота за ім'ям", "delete_cat"),
     "6": ("Видалити всіх котів", "delete_all"),
     "7": ("Додати нового кота", "add_cat"),
+    "8": ("Статистика котів", "show_stats"),
     "0": ("Вийти", "exit"),
 }
 
@@ -85,11 +112,16 @@ def get_log_file():
     return LOG_DIR / f"cats_app_{timestamp}.log"
 
 
+def get_logger():
+    """Повертає логер застосунку без створення файлу логу"""
+    logging.setLoggerClass(CustomLogger)
+    return logging.getLogger(__name__)
+
+
 def setup_logging():
     """Налаштування системи логування"""
-    logging.setLoggerClass(CustomLogger)
+    logger = get_logger()
     logging.basicConfig(filename=get_log_file(), level=LOG_LEVEL, format=LOG_FORMAT)
-    logger = logging.getLogger(__name__)
     return logger
 
 
@@ -100,13 +132,23 @@ def validate_config():
         if not all([result.scheme, result.netloc]):
             raise ValueError("Неправильний формат MONGO_URI")
 
+        if STORAGE_BACKEND not in ("mongo", "memory"):
+            raise ValueError("STORAGE_BACKEND має бути 'mongo' або 'memory'")
+
+        if READ_PREFERENCE not in READ_PREFERENCES:
+            raise ValueError(f"READ_PREFERENCE має бути одним з {READ_PREFERENCES}")
+
+        if MAX_STALENESS_SECONDS != -1 and (
+            MAX_STALENESS_SECONDS < 90 or READ_PREFERENCE == "primary"
+        ):
+            raise ValueError(
+                "MAX_STALENESS_SECONDS має бути -1 або не менше 90 "
+                "і не використовується з READ_PREFERENCE=primary"
+            )
+
         if not all([DATABASE_NAME, COLLECTION_NAME]):
             raise ValueError(
                 "DATABASE_NAME та COLLECTION_NAME не можуть бути порожніми"
             )
     except Exception as e:
         raise ValueError(f"Помилка конфігурації: {e}")
-
-
-# Валідація конфігурації при імпорті
-validate_config()
@@ -1,11 +1,127 @@
-from config import MONGO_TIMEOUT, setup_logging
+import threading
+
+from config import (
+    COLLECTION_NAME,
+    DATABASE_NAME,
+    MAX_STALENESS_SECONDS,
+    MEMORY_SNAPSHOT_FILE,
+    MONGO_TIMEOUT,
+    MONGO_URI,
+    READ_PREFERENCE,
+    READ_YOUR_WRITES,
+    STORAGE_BACKEND,
+    get_logger,
+)
 from pymongo import MongoClient
 from pymongo.errors import ServerSelectionTimeoutError
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+logger = get_logger()
+
+READ_PREFERENCE_CLASSES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# Методи колекції, які виконуються на члені replica set згідно з read preference
+READ_METHODS = frozenset(
+    {"find", "find_one", "count_documents", "aggregate", "distinct"}
+)
+# Методи, що приймають session (решта атрибутів береться з primary без змін)
+WRITE_METHODS = frozenset(
+    {
+        "insert_one",
+        "insert_many",
+        "update_one",
+        "update_many",
+        "replace_one",
+        "delete_one",
+        "delete_many",
+        "bulk_write",
+        "find_one_and_update",
+        "find_one_and_delete",
+    }
+)
+
+
+def build_read_preference(mode: str, max_staleness: int = -1):
+    """Створює об'єкт read preference pymongo за назвою режиму"""
+    if mode == "primary":
+        return Primary()
+    return READ_PREFERENCE_CLASSES[mode](max_staleness=max_staleness)
+
+
+class RoutedCollection:
+    """Колекція, що надсилає читання згідно з read preference, а записи — на primary"""
+
+    def __init__(self, collection, read_preference, read_your_writes: bool = False):
+        self.primary = collection.with_options(read_preference=Primary())
+        self.reads = collection.with_options(read_preference=read_preference)
+        self.read_your_writes = read_your_writes
+        # Сесії pymongo не потокобезпечні, тому кожен потік має власну;
+        # усі створені сесії завершуються в close()
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self):
+        if not self.read_your_writes:
+            return None
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.primary.database.client.start_session(
+                causal_consistency=True
+            )
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Завершує причинно-узгоджені сесії всіх потоків"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.end_session()
+
+    def __getattr__(self, name):
+        if name in READ_METHODS:
+            target = getattr(self.reads, name)
+        elif name in WRITE_METHODS:
+            target = getattr(self.primary, name)
+        else:
+            return getattr(self.primary, name)
+
+        def call(*args, **kwargs):
+            kwargs.setdefault("session", self._session())
+            return target(*args, **kwargs)
 
-logger = setup_logging()
+        return call
 
 
-def get_db_connection(uri: str, db_name: str, collection_name: str):
+def primary_collection(collection):
+    """Колекція для перевірок перед записом: читання з primary, а не з репліки"""
+    if isinstance(collection, RoutedCollection):
+        return collection.primary
+    return collection
+
+
+def get_db_connection(
+    uri: str,
+    db_name: str,
+    collection_name: str,
+    read_preference: str = READ_PREFERENCE,
+    max_staleness: int = MAX_STALENESS_SECONDS,
+    read_your_writes: bool = READ_YOUR_WRITES,
+):
     """Створює підключення до MongoDB"""
     if not all([uri, db_name, collection_name]):
         raise ValueError("URI, назва бази даних та колекції не можуть бути порожніми")
@@ -19,10 +135,34 @@ def get_db_connection(uri: str, db_name: str, collection_name: str):
         logger.info(
             f"Підключення до MongoDB успішне. БД: {db_name}, Колекція: {collection_name}"
         )
-        return collection
+        if read_preference == "primary" and not read_your_writes:
+            return collection
+
+        logger.info(
+            f"Читання: {read_preference}, maxStalenessSeconds: {max_staleness}, "
+            f"read-your-writes: {read_your_writes}"
+        )
+        return RoutedCollection(
+            collection,
+            build_read_preference(read_preference, max_staleness),
+            read_your_writes,
+        )
     except ServerSelectionTimeoutError:
         logger.error("MongoDB сервер недоступний")
         raise
     except Exception as e:
         logger.error(f"Помилка при підключенні до MongoDB: {e}")
         raise
+
+
+def get_collection(backend: str = STORAGE_BACKEND):
+    """Повертає колекцію котів для обраного сховища (mongo або memory)"""
+    if backend == "memory":
+        from memory_backend import MemoryCollection
+
+        collection = MemoryCollection(MEMORY_SNAPSHOT_FILE or None)
+        logger.info(
+            f"Використовується сховище в пам'яті. Знімок: {MEMORY_SNAPSHOT_FILE or 'немає'}"
+        )
+        return collection
+    return get_db_connection(MONGO_URI, DATABASE_NAME, COLLECTION_NAME)
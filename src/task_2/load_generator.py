@@ -0,0 +1,250 @@
+"""
+Генератор змішаного навантаження для функцій cats_manager.
+
+Режими:
+  * closed  — N потоків виконують операції одна за одною без пауз;
+  * open    — операції запускаються з фіксованою частотою (--rate) незалежно
+              від часу відповіді; затримка рахується від запланованого моменту
+              запуску, тому черга в пулі потоків теж потрапляє в результат.
+
+Ключі (імена котів) обираються з розподілом Ципфа (--skew 0 — рівномірно).
+Звіт містить пропускну здатність і перцентилі затримки за інтервалами
+(--interval) для кожної операції та записується у CSV або JSON.
+
+Приклад запуску проти локального mongod:
+    python load_generator.py --mode open --rate 2000 --duration 30 \\
+        --mix find=80,update=10,feature=5,insert=3,delete=2 --skew 1.1 \\
+        --output load_report.csv
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cats_manager import (
+    add_feature_to_cat,
+    delete_cat_by_name,
+    find_cat_by_name,
+    insert_cat,
+    update_cat_age,
+)
+from config import MONGO_URI, setup_logging
+from db_connection import get_db_connection
+from memory_backend import MemoryCollection
+
+FEATURES = ["пухнастий", "рудий", "лінивий", "грайливий", "смугастий", "чорний"]
+
+OPERATIONS = {
+    "find": lambda col, name: find_cat_by_name(col, name)[1] is None,
+    "update": lambda col, name: update_cat_age(col, name, random.randint(1, 30))[0],
+    "feature": lambda col, name: add_feature_to_cat(
+        col, name, random.choice(FEATURES)
+    )[0],
+    "insert": lambda col, name: insert_cat(
+        col, name, random.randint(1, 30), random.sample(FEATURES, 2)
+    )[0],
+    "delete": lambda col, name: delete_cat_by_name(col, name),
+}
+
+DEFAULT_MIX = "find=80,update=10,feature=5,insert=3,delete=2"
+
+
+def parse_mix(mix: str) -> tuple[list, list]:
+    """Розбирає рядок виду 'find=80,update=20' у списки операцій та ваг"""
+    names, weights = [], []
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Невідома операція '{name}'. Доступні: {list(OPERATIONS)}"
+            )
+        names.append(name)
+        weights.append(float(weight))
+    if sum(weights) <= 0:
+        raise ValueError("Сума ваг операцій має бути додатною")
+    return names, weights
+
+
+class KeyChooser:
+    """Вибір імені кота з розподілом Ципфа над простором ключів"""
+
+    def __init__(self, keys: int, skew: float):
+        self.keys = [f"cat_{i:06d}" for i in range(keys)]
+        weights = [1 / (rank**skew) for rank in range(1, keys + 1)]
+        self.cum_weights = list(itertools.accumulate(weights))
+        # Ранги перемішуються, щоб "гарячі" ключі не йшли підряд
+        random.shuffle(self.keys)
+
+    def choose(self) -> str:
+        return random.choices(self.keys, cum_weights=self.cum_weights)[0]
+
+
+class LoadGenerator:
+    """Запускає операції та збирає (час завершення, операція, затримка, успіх)"""
+
+    def __init__(self, collection, mix: str, keys: int, skew: float):
+        self.collection = collection
+        self.op_names, self.op_weights = parse_mix(mix)
+        self.chooser = KeyChooser(keys, skew)
+        self.samples = deque()
+        self.start = None
+
+    def preload(self, count: int) -> None:
+        """Очищує колекцію та заповнює її першими count ключами простору"""
+        self.collection.delete_many({})
+        cats = [
+            {
+                "name": name,
+                "age": random.randint(1, 30),
+                "features": random.sample(FEATURES, 2),
+            }
+            for name in self.chooser.keys[:count]
+        ]
+        if cats:
+            self.collection.insert_many(cats, ordered=False)
+
+    def _execute(self, scheduled_at: float) -> None:
+        op = random.choices(self.op_names, weights=self.op_weights)[0]
+        name = self.chooser.choose()
+        try:
+            ok = bool(OPERATIONS[op](self.collection, name))
+        except Exception:
+            ok = False
+        finished = time.perf_counter()
+        self.samples.append(
+            (finished - self.start, op, (finished - scheduled_at) * 1000, ok)
+        )
+
+    def run_closed(self, workers: int, duration: float) -> None:
+        """Закрита модель: workers потоків без пауз між операціями"""
+        self.start = time.perf_counter()
+        deadline = self.start + duration
+
+        def worker():
+            while time.perf_counter() < deadline:
+                self._execute(time.perf_counter())
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def run_open(self, workers: int, duration: float, rate: float) -> None:
+        """Відкрита модель: rate операцій за секунду за розкладом"""
+        self.start = time.perf_counter()
+        total = int(duration * rate)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(total):
+                scheduled_at = self.start + i / rate
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._execute, scheduled_at)
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Перцентиль відсортованого списку (метод найближчого рангу)"""
+    if not sorted_values:
+        return 0.0
+    rank = round(p / 100 * len(sorted_values))
+    index = max(0, min(len(sorted_values) - 1, rank - 1))
+    return sorted_values[index]
+
+
+def build_report(samples, interval: float) -> list[dict]:
+    """Групує вибірки за інтервалами та операціями"""
+    buckets = defaultdict(list)
+    for finished, op, latency, ok in samples:
+        bucket = int(finished // interval)
+        buckets[(bucket, op)].append((latency, ok))
+        buckets[(bucket, "all")].append((latency, ok))
+
+    rows = []
+    for (bucket, op), values in sorted(buckets.items()):
+        latencies = sorted(latency for latency, _ in values)
+        rows.append(
+            {
+                "interval_start_s": round(bucket * interval, 3),
+                "operation": op,
+                "count": len(values),
+                "ok": sum(1 for _, ok in values if ok),
+                "throughput_ops_s": round(len(values) / interval, 1),
+                "p50_ms": round(percentile(latencies, 50), 3),
+                "p95_ms": round(percentile(latencies, 95), 3),
+                "p99_ms": round(percentile(latencies, 99), 3),
+                "max_ms": round(latencies[-1], 3),
+            }
+        )
+    return rows
+
+
+def write_report(rows: list[dict], output: Path) -> None:
+    """Записує звіт у CSV або JSON залежно від розширення файлу"""
+    if output.suffix.lower() == ".json":
+        output.write_text(json.dumps(rows, ensure_ascii=False, indent=2), "utf-8")
+        return
+    with output.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Навантажувальний тест cats_manager")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--workers", type=int, default=8, help="кількість потоків")
+    parser.add_argument("--rate", type=float, default=1000, help="операцій/с (open)")
+    parser.add_argument("--duration", type=float, default=10, help="тривалість, с")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="ваги операцій")
+    parser.add_argument("--keys", type=int, default=10000, help="розмір простору імен")
+    parser.add_argument("--skew", type=float, default=0.0, help="параметр Ципфа")
+    parser.add_argument(
+        "--preload",
+        type=int,
+        default=None,
+        help="котів до тесту (колекцію буде очищено; за замовчуванням --keys)",
+    )
+    parser.add_argument("--interval", type=float, default=1.0, help="інтервал звіту, с")
+    parser.add_argument("--backend", choices=("mongo", "memory"), default="mongo")
+    parser.add_argument("--uri", default=MONGO_URI)
+    parser.add_argument("--database", default="cats_load")
+    parser.add_argument("--collection", default="cats")
+    parser.add_argument("--output", type=Path, default=Path("load_report.csv"))
+    args = parser.parse_args()
+
+    setup_logging()
+    if args.backend == "memory":
+        collection = MemoryCollection()
+    else:
+        collection = get_db_connection(args.uri, args.database, args.collection)
+        collection.create_index("name")
+
+    generator = LoadGenerator(collection, args.mix, args.keys, args.skew)
+    generator.preload(args.keys if args.preload is None else args.preload)
+
+    if args.mode == "closed":
+        generator.run_closed(args.workers, args.duration)
+    else:
+        generator.run_open(args.workers, args.duration, args.rate)
+
+    rows = build_report(generator.samples, args.interval)
+    write_report(rows, args.output)
+
+    # Підсумок за весь тест: один інтервал, що охоплює всі вибірки
+    elapsed = max((sample[0] for sample in generator.samples), default=0) + 1e-9
+    totals = build_report(generator.samples, elapsed)
+    print(json.dumps(totals, ensure_ascii=False, indent=2))
+    print(f"Звіт за інтервалами записано у {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
+from cats_analytics import (
+    age_histogram,
+    average_age_by_feature,
+    count_cats_without_features,
+    ensure_analytics_indexes,
+)
 from cats_manager import (
     add_feature_to_cat,
     delete_all_cats,
@@ -9,22 +15,20 @@ from cats_manager import (
 )
 from colorama import init
 from config import (
-    COLLECTION_NAME,
     COLORS,
-    DATABASE_NAME,
     MESSAGES,
-    MONGO_URI,
+    STORAGE_BACKEND,
+    get_logger,
     setup_logging,
+    validate_config,
 )
-from db_connection import get_db_connection
+from db_connection import RoutedCollection, get_collection
 from pymongo.errors import ServerSelectionTimeoutError
 from validators import validate_age, validate_features, validate_name
 
-# Ініціалізація colorama
-init()
-
-# Налаштування логування
-logger = setup_logging()
+# colorama, файл логу та перевірка конфігурації ініціалізуються лише під час
+# запуску скрипта, а не при імпорті модуля
+logger = get_logger()
 
 
 def format_error(message: str) -> str:
@@ -51,6 +55,7 @@ class CatManager:
             "5": ("Видалити кота за ім'ям", self.delete_cat),
             "6": ("Видалити всіх котів", self.delete_all),
             "7": ("Додати нового кота", self.add_cat),
+            "8": ("Статистика котів", self.show_stats),
             "0": ("Вийти", None),
         }
 
@@ -261,6 +266,32 @@ class CatManager:
             )
             print(format_error("Помилка додавання кота"))
 
+    def show_stats(self):
+        histogram, error = age_histogram(self.collection)
+        if error:
+            handle_error(error)
+            return
+        by_feature, error = average_age_by_feature(self.collection)
+        if error:
+            handle_error(error)
+            return
+        without_features, error = count_cats_without_features(self.collection)
+        if error:
+            handle_error(error)
+            return
+
+        self._log_action("Статистика котів", "", "успішно отримано")
+        print(f"{COLORS['header']}=== Статистика котів ==={COLORS['reset']}")
+        print("Розподіл за віком:")
+        for bucket in histogram:
+            print(f"  від {bucket['from']}: {bucket['count']}")
+        print("Середній вік за характеристиками:")
+        for row in by_feature:
+            age = row["average_age"]
+            age_text = f"{age} років" if age is not None else "вік невідомий"
+            print(f"  - {row['feature']}: {age_text} ({row['count']} котів)")
+        print(f"Котів без характеристик: {without_features}")
+
 
 def main_menu(collection):
     manager = CatManager(collection)
@@ -300,9 +331,18 @@ def main_menu(collection):
 
 
 if __name__ == "__main__":
+    init()
+    setup_logging()
+    collection = None
     try:
-        collection = get_db_connection(MONGO_URI, DATABASE_NAME, COLLECTION_NAME)
+        validate_config()
+        collection = get_collection()
+        if STORAGE_BACKEND == "mongo":
+            ensure_analytics_indexes(collection)
         main_menu(collection)
+    except KeyboardInterrupt:
+        print(MESSAGES["exit"])
+        logger.warning("Роботу програми перервано користувачем")
     except ServerSelectionTimeoutError:
         print(
             f"{COLORS['error']}Не вдалося підключитися до бази даних. Програму завершено.{COLORS['reset']}"
@@ -311,3 +351,15 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"{COLORS['error']}Неочікувана помилка: {e}{COLORS['reset']}")
         logger.error(f"Неочікувана помилка: {e}")
+    finally:
+        # Сховище в пам'яті зберігає знімок на диск під час закриття,
+        # у т.ч. після Ctrl+C або помилки; помилка закриття лише логується,
+        # щоб не приховати початкову причину завершення
+        try:
+            if STORAGE_BACKEND == "memory" and collection is not None:
+                collection.close()
+            if isinstance(collection, RoutedCollection):
+                collection.close()
+        except Exception as e:
+            print(f"{COLORS['error']}Помилка закриття сховища: {e}{COLORS['reset']}")
+            logger.error(f"Помилка закриття сховища: {e}")
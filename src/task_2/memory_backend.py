@@ -0,0 +1,337 @@
+"""
+In-process сховище котів, сумісне з функціями cats_manager.
+
+MemoryCollection реалізує підмножину API pymongo Collection, якою користується
+cats_manager, write_buffer та load_generator (find, find_one, insert_one,
+insert_many, update_one, bulk_write з UpdateOne, delete_one, delete_many,
+count_documents), тому всі функції cats_manager працюють без змін і зберігають
+контракт (result, error). Дані зберігаються в компактних записах з __slots__:
+  * хеш-індекс за name (ім'я -> запис);
+  * інвертований індекс за features (характеристика -> множина імен).
+
+Необов'язковий знімок (snapshot) зберігається у JSON-файл атомарно
+(тимчасовий файл + os.replace) під час save()/close() і завантажується
+при створенні колекції.
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+from operator import ge, gt, le, lt
+from pathlib import Path
+
+from pymongo import UpdateOne
+from pymongo.errors import (
+    BulkWriteError,
+    DuplicateKeyError,
+    OperationFailure,
+    PyMongoError,
+)
+from pymongo.results import (
+    BulkWriteResult,
+    DeleteResult,
+    InsertManyResult,
+    InsertOneResult,
+    UpdateResult,
+)
+
+logger = logging.getLogger(__name__)
+
+RANGE_OPERATORS = {
+    "$gt": gt,
+    "$gte": ge,
+    "$lt": lt,
+    "$lte": le,
+}
+
+
+class CatRecord:
+    """Компактний запис кота"""
+
+    __slots__ = ("_id", "name", "age", "features")
+
+    def __init__(self, _id: int, name: str, age: int, features: list):
+        self._id = _id
+        self.name = name
+        self.age = age
+        self.features = features
+
+    def to_document(self, projection: dict | None = None) -> dict:
+        """Повертає копію запису у вигляді документа MongoDB"""
+        document = {
+            "_id": self._id,
+            "name": self.name,
+            "age": self.age,
+            "features": list(self.features),
+        }
+        if projection:
+            fields = {key for key, value in projection.items() if value}
+            fields.add("_id")
+            document = {key: document[key] for key in document if key in fields}
+        return document
+
+
+class MemoryCollection:
+    """Колекція котів у пам'яті з індексами за ім'ям та характеристиками"""
+
+    def __init__(self, snapshot_file: Path | str | None = None):
+        self.snapshot_file = Path(snapshot_file) if snapshot_file else None
+        self.name = self.snapshot_file.stem if self.snapshot_file else "memory"
+        self._by_name: dict[str, CatRecord] = {}
+        self._by_feature: dict[str, set[str]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        if self.snapshot_file and self.snapshot_file.exists():
+            self.load()
+
+    def _match(self, filter: dict) -> list[CatRecord]:
+        """Повертає записи, що відповідають фільтру, з використанням індексів"""
+        if not filter:
+            return list(self._by_name.values())
+        if set(filter) == {"$and"}:
+            matched = None
+            for condition in filter["$and"]:
+                ids = {record._id for record in self._match(condition)}
+                matched = ids if matched is None else matched & ids
+            return [r for r in self._by_name.values() if r._id in (matched or ())]
+        if len(filter) != 1:
+            raise OperationFailure(f"Непідтримуваний фільтр: {filter}")
+
+        field, condition = next(iter(filter.items()))
+        if field == "_id" and isinstance(condition, dict):
+            # Діапазон _id (пакетне видалення) — повний перегляд записів
+            if not set(condition) <= set(RANGE_OPERATORS):
+                raise OperationFailure(f"Непідтримуваний оператор: {condition}")
+            return [
+                record
+                for record in self._by_name.values()
+                if all(
+                    RANGE_OPERATORS[op](record._id, value)
+                    for op, value in condition.items()
+                )
+            ]
+        if isinstance(condition, dict):
+            if set(condition) != {"$in"}:
+                raise OperationFailure(f"Непідтримуваний оператор: {condition}")
+            values = condition["$in"]
+        else:
+            values = [condition]
+
+        if field == "name":
+            names = dict.fromkeys(values)
+        elif field == "features":
+            names = set().union(
+                *(self._by_feature.get(v, ()) for v in values if v not in (None, []))
+            )
+            if any(v in (None, []) for v in values):
+                # null або [] відповідають котам без характеристик
+                names.update(n for n, r in self._by_name.items() if not r.features)
+        else:
+            raise OperationFailure(f"Поле '{field}' не індексоване")
+        return [self._by_name[name] for name in names if name in self._by_name]
+
+    def find(
+        self,
+        filter: dict | None = None,
+        projection: dict | None = None,
+        sort: list | None = None,
+        limit: int = 0,
+    ):
+        """Повертає список документів (замість курсора pymongo)"""
+        with self._lock:
+            records = self._match(filter or {})
+            for field, direction in reversed(sort or []):
+                records.sort(key=lambda r: getattr(r, field), reverse=direction < 0)
+            if limit:
+                records = records[:limit]
+            return [record.to_document(projection) for record in records]
+
+    def find_one(self, filter: dict | None = None, projection: dict | None = None):
+        with self._lock:
+            records = self._match(filter or {})
+            return records[0].to_document(projection) if records else None
+
+    def count_documents(self, filter: dict) -> int:
+        with self._lock:
+            return len(self._match(filter))
+
+    def aggregate(self, pipeline: list):
+        raise OperationFailure("Агрегації не підтримуються сховищем у пам'яті")
+
+    def _index_features(self, name: str, features) -> None:
+        for feature in features:
+            self._by_feature.setdefault(feature, set()).add(name)
+
+    def _unindex_features(self, name: str, features) -> None:
+        for feature in features:
+            names = self._by_feature.get(feature)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_feature[feature]
+
+    def insert_one(self, document: dict) -> InsertOneResult:
+        with self._lock:
+            name = document["name"]
+            if name in self._by_name:
+                raise DuplicateKeyError(f"Кіт з ім'ям '{name}' вже існує")
+            features = list(dict.fromkeys(document.get("features", [])))
+            record = CatRecord(next(self._ids), name, document.get("age"), features)
+            self._by_name[name] = record
+            self._index_features(name, features)
+            return InsertOneResult(record._id, True)
+
+    def insert_many(self, documents: list, ordered: bool = True) -> InsertManyResult:
+        inserted_ids = []
+        with self._lock:
+            for document in documents:
+                try:
+                    inserted_ids.append(self.insert_one(document).inserted_id)
+                except DuplicateKeyError:
+                    if ordered:
+                        raise
+        return InsertManyResult(inserted_ids, True)
+
+    def update_one(self, filter: dict, update: dict) -> UpdateResult:
+        with self._lock:
+            records = self._match(filter)
+            if not records:
+                return UpdateResult({"n": 0, "nModified": 0}, True)
+
+            record = records[0]
+            modified = False
+            for operator, fields in update.items():
+                if operator == "$set":
+                    for field, value in fields.items():
+                        if field not in ("age", "features"):
+                            raise OperationFailure(f"Поле '{field}' не підтримується")
+                        if getattr(record, field) != value:
+                            if field == "features":
+                                self._unindex_features(record.name, record.features)
+                                value = list(value)
+                                self._index_features(record.name, value)
+                            setattr(record, field, value)
+                            modified = True
+                elif operator == "$addToSet":
+                    values = fields.get("features")
+                    if values is None or len(fields) != 1:
+                        raise OperationFailure(f"Непідтримуване оновлення: {fields}")
+                    if isinstance(values, dict):
+                        values = values["$each"]
+                    else:
+                        values = [values]
+                    for value in values:
+                        if value not in record.features:
+                            record.features.append(value)
+                            self._index_features(record.name, [value])
+                            modified = True
+                else:
+                    raise OperationFailure(f"Непідтримуваний оператор: {operator}")
+
+            return UpdateResult({"n": 1, "nModified": int(modified)}, True)
+
+    def bulk_write(self, requests: list, ordered: bool = True) -> BulkWriteResult:
+        """Виконує пакет UpdateOne (write_buffer.CatWriteBuffer)"""
+        matched = modified = 0
+        write_errors = []
+        with self._lock:
+            for index, request in enumerate(requests):
+                if not isinstance(request, UpdateOne):
+                    raise OperationFailure(
+                        f"Непідтримувана операція: {type(request).__name__}"
+                    )
+                try:
+                    result = self.update_one(request._filter, request._doc)
+                except OperationFailure as e:
+                    write_errors.append({"index": index, "errmsg": str(e)})
+                    if ordered:
+                        break
+                    continue
+                matched += result.matched_count
+                modified += result.modified_count
+
+        details = {
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": matched,
+            "nModified": modified,
+            "nRemoved": 0,
+            "upserted": [],
+            "writeErrors": write_errors,
+        }
+        if write_errors:
+            raise BulkWriteError(details)
+        return BulkWriteResult(details, True)
+
+    def _delete(self, records: list[CatRecord]) -> DeleteResult:
+        for record in records:
+            del self._by_name[record.name]
+            self._unindex_features(record.name, record.features)
+        return DeleteResult({"n": len(records)}, True)
+
+    def delete_one(self, filter: dict) -> DeleteResult:
+        with self._lock:
+            return self._delete(self._match(filter)[:1])
+
+    def delete_many(self, filter: dict) -> DeleteResult:
+        with self._lock:
+            if not filter:
+                count = len(self._by_name)
+                self._by_name.clear()
+                self._by_feature.clear()
+                return DeleteResult({"n": count}, True)
+            return self._delete(self._match(filter))
+
+    def estimated_document_count(self) -> int:
+        return len(self._by_name)
+
+    def index_information(self) -> dict:
+        return {"_id_": {"key": [("_id", 1)]}}
+
+    def create_index(self, keys, **kwargs) -> None:
+        """Індекси за name та features підтримуються завжди"""
+
+    def drop(self) -> None:
+        self.delete_many({})
+
+    def save(self) -> None:
+        """Атомарно записує знімок колекції у snapshot_file"""
+        if not self.snapshot_file:
+            return
+        with self._lock:
+            rows = [
+                [record._id, record.name, record.age, record.features]
+                for record in self._by_name.values()
+            ]
+            tmp_file = self.snapshot_file.with_suffix(".tmp")
+            try:
+                with tmp_file.open("w", encoding="utf-8") as f:
+                    json.dump(rows, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_file, self.snapshot_file)
+            except OSError as e:
+                logger.error(f"Помилка збереження знімка {self.snapshot_file}: {e}")
+                raise PyMongoError(str(e)) from e
+        logger.info(f"Знімок збережено: {self.snapshot_file} ({len(rows)} котів)")
+
+    def load(self) -> None:
+        """Завантажує колекцію зі snapshot_file, замінюючи поточні дані"""
+        with self._lock:
+            try:
+                rows = json.loads(self.snapshot_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.error(f"Помилка читання знімка {self.snapshot_file}: {e}")
+                raise PyMongoError(str(e)) from e
+
+            self._by_name.clear()
+            self._by_feature.clear()
+            for _id, name, age, features in rows:
+                self._by_name[name] = CatRecord(_id, name, age, features)
+                self._index_features(name, features)
+            self._ids = itertools.count(max((row[0] for row in rows), default=0) + 1)
+        logger.info(f"Знімок завантажено: {self.snapshot_file} ({len(rows)} котів)")
+
+    def close(self) -> None:
+        """Зберігає знімок перед завершенням роботи"""
+        self.save()
@@ -0,0 +1,135 @@
+"""
+Локальний replica set з трьох членів на одному хості для перевірки
+маршрутизації читань (READ_PREFERENCE, MAX_STALENESS_SECONDS, READ_YOUR_WRITES).
+
+Команди:
+    python replica_set.py start   # запускає 3 процеси mongod та ініціалізує rs0
+    python replica_set.py status  # стан членів та відставання secondary
+    python replica_set.py stop    # зупиняє всі члени
+
+Після запуску:
+    MONGO_URI="mongodb://localhost:27017,localhost:27018,localhost:27019/?replicaSet=rs0" \\
+    READ_PREFERENCE=secondaryPreferred python main.py
+"""
+
+import argparse
+import subprocess
+import time
+from pathlib import Path
+
+from config import SCRIPT_DIR
+from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure, OperationFailure
+
+REPLICA_SET = "rs0"
+
+
+def member_ports(base_port: int) -> list[int]:
+    return [base_port + i for i in range(3)]
+
+
+def replica_set_uri(base_port: int) -> str:
+    hosts = ",".join(f"localhost:{port}" for port in member_ports(base_port))
+    return f"mongodb://{hosts}/?replicaSet={REPLICA_SET}"
+
+
+def direct_client(port: int) -> MongoClient:
+    return MongoClient(
+        f"mongodb://localhost:{port}/?directConnection=true",
+        serverSelectionTimeoutMS=2000,
+    )
+
+
+def start(base_port: int, data_dir: Path) -> None:
+    """Запускає члени replica set та ініціалізує його, якщо потрібно"""
+    for port in member_ports(base_port):
+        member_dir = data_dir / str(port)
+        member_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.Popen(
+            [
+                "mongod",
+                "--replSet",
+                REPLICA_SET,
+                "--port",
+                str(port),
+                "--bind_ip",
+                "localhost",
+                "--dbpath",
+                str(member_dir),
+                "--logpath",
+                str(member_dir / "mongod.log"),
+            ],
+            start_new_session=True,
+        )
+
+    client = direct_client(base_port)
+    for _ in range(30):
+        try:
+            client.admin.command("ping")
+            break
+        except ConnectionFailure:
+            time.sleep(1)
+
+    config = {
+        "_id": REPLICA_SET,
+        "members": [
+            {"_id": i, "host": f"localhost:{port}"}
+            for i, port in enumerate(member_ports(base_port))
+        ],
+    }
+    try:
+        client.admin.command("replSetInitiate", config)
+        print(f"Replica set {REPLICA_SET} ініціалізовано")
+    except OperationFailure as e:
+        # Код 23: AlreadyInitialized
+        if e.code != 23:
+            raise
+    client.close()
+    print(f"MONGO_URI={replica_set_uri(base_port)}")
+
+
+def status(base_port: int) -> None:
+    """Друкує стан членів та відставання secondary від primary"""
+    uri = replica_set_uri(base_port)
+    with MongoClient(uri, serverSelectionTimeoutMS=5000) as client:
+        members = client.admin.command("replSetGetStatus")["members"]
+    primary_optime = max(m["optimeDate"] for m in members if "optimeDate" in m)
+    for member in members:
+        if "optimeDate" not in member:
+            print(f"{member['name']}: {member['stateStr']}")
+            continue
+        lag = (primary_optime - member["optimeDate"]).total_seconds()
+        print(f"{member['name']}: {member['stateStr']}, відставання {lag:.0f} с")
+
+
+def stop(base_port: int) -> None:
+    """Зупиняє всі члени replica set"""
+    for port in member_ports(base_port):
+        client = direct_client(port)
+        try:
+            client.admin.command("shutdown", force=True)
+        except ConnectionFailure:
+            # Сервер закриває з'єднання під час зупинки
+            pass
+        finally:
+            client.close()
+        print(f"localhost:{port} зупинено")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальний replica set з 3 членів")
+    parser.add_argument("command", choices=("start", "status", "stop"))
+    parser.add_argument("--base-port", type=int, default=27017)
+    parser.add_argument("--data-dir", type=Path, default=SCRIPT_DIR / "rs-data")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        start(args.base_port, args.data_dir)
+    elif args.command == "status":
+        status(args.base_port)
+    else:
+        stop(args.base_port)
+
+
+if __name__ == "__main__":
+    main()
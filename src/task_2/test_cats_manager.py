@@ -0,0 +1,164 @@
+"""
+Тести функцій cats_manager на обох сховищах: MongoDB та MemoryCollection.
+
+Тести MongoDB пропускаються, якщо сервер MONGO_URI недоступний; дані
+записуються в окрему базу cats_test, яка видаляється після кожного тесту.
+
+Запуск:
+    python -m pytest -q test_cats_manager.py
+"""
+
+import pytest
+from cats_manager import (
+    add_feature_to_cat,
+    delete_all_cats,
+    delete_cat_by_name,
+    find_cat_by_name,
+    insert_cat,
+    show_all_cats,
+    update_cat_age,
+    validate_cat_exists,
+)
+from config import MONGO_URI
+from memory_backend import MemoryCollection
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+TEST_DATABASE = "cats_test"
+
+
+@pytest.fixture(scope="module")
+def mongo_client():
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip(f"MongoDB недоступна за адресою {MONGO_URI}")
+    yield client
+    client.close()
+
+
+@pytest.fixture(params=["memory", "mongo"])
+def collection(request):
+    if request.param == "memory":
+        yield MemoryCollection()
+        return
+
+    client = request.getfixturevalue("mongo_client")
+    client.drop_database(TEST_DATABASE)
+    yield client[TEST_DATABASE]["cats"]
+    client.drop_database(TEST_DATABASE)
+
+
+@pytest.fixture
+def murka(collection):
+    assert insert_cat(collection, "Мурка", 3, ["сіра", "лінива"]) == (True, None)
+    return collection
+
+
+def test_insert_and_find(murka):
+    cat, error = find_cat_by_name(murka, "Мурка")
+    assert error is None
+    assert (cat["name"], cat["age"], cat["features"]) == (
+        "Мурка",
+        3,
+        ["сіра", "лінива"],
+    )
+
+
+def test_insert_duplicate(murka):
+    assert insert_cat(murka, "Мурка", 5, []) == (False, "Кіт з таким ім'ям вже існує")
+
+
+def test_find_not_found(collection):
+    assert find_cat_by_name(collection, "Барсик") == (
+        None,
+        "Кота з ім'ям 'Барсик' не знайдено",
+    )
+
+
+def test_find_invalid_name(collection):
+    assert find_cat_by_name(collection, " ") == (
+        None,
+        "Ім'я кота не може бути порожнім",
+    )
+
+
+def test_validate_cat_exists(murka):
+    assert validate_cat_exists(murka, "Мурка") == (True, "")
+    assert validate_cat_exists(murka, "Барсик") == (
+        False,
+        "Кота з ім'ям 'Барсик' не знайдено",
+    )
+
+
+def test_show_all_cats(murka):
+    assert insert_cat(murka, "Барсик", 2, []) == (True, None)
+    cats, error = show_all_cats(murka)
+    assert error is None
+    assert sorted(cat["name"] for cat in cats) == ["Барсик", "Мурка"]
+
+
+def test_show_all_cats_empty(collection):
+    assert show_all_cats(collection) == ([], None)
+
+
+def test_update_age(murka):
+    assert update_cat_age(murka, "Мурка", 4) == (True, None)
+    assert find_cat_by_name(murka, "Мурка")[0]["age"] == 4
+
+
+def test_update_same_age(murka):
+    assert update_cat_age(murka, "Мурка", 3) == (
+        False,
+        "Вік не було оновлено (можливо, вказано той самий вік)",
+    )
+
+
+def test_update_age_not_found(collection):
+    assert update_cat_age(collection, "Барсик", 4) == (
+        False,
+        "Кота з ім'ям 'Барсик' не знайдено",
+    )
+
+
+def test_add_feature(murka):
+    assert add_feature_to_cat(murka, "Мурка", "пухнаста") == (True, None)
+    features = find_cat_by_name(murka, "Мурка")[0]["features"]
+    assert features == ["сіра", "лінива", "пухнаста"]
+
+
+def test_add_duplicate_feature(murka):
+    assert add_feature_to_cat(murka, "Мурка", "сіра") == (
+        False,
+        "Ця характеристика вже існує",
+    )
+
+
+def test_add_feature_not_found(collection):
+    assert add_feature_to_cat(collection, "Барсик", "рудий") == (
+        False,
+        "Кота з ім'ям 'Барсик' не знайдено",
+    )
+
+
+def test_add_empty_feature(murka):
+    assert add_feature_to_cat(murka, "Мурка", " , ") == (
+        False,
+        "Потрібно вказати хоча б одну характеристику",
+    )
+
+
+def test_delete_cat(murka):
+    assert delete_cat_by_name(murka, "Мурка") is True
+    assert delete_cat_by_name(murka, "Мурка") is False
+    assert find_cat_by_name(murka, "Мурка")[0] is None
+
+
+def test_delete_all_cats(murka):
+    for i in range(25):
+        assert insert_cat(murka, f"Кіт {i}", 1 + i % 30, []) == (True, None)
+    assert delete_all_cats(murka) == 26
+    assert show_all_cats(murka) == ([], None)
+    assert delete_all_cats(murka) == 0
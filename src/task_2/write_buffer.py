@@ -0,0 +1,226 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from cats_analytics import invalidate_analytics
+from config import WRITE_BUFFER_DELAY_MS, WRITE_BUFFER_MAX_OPS
+from db_connection import primary_collection
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from validators import validate_features, validate_name
+
+logger = logging.getLogger(__name__)
+
+
+def _resolved(success: bool, error: str | None) -> Future:
+    """Повертає вже завершений Future з результатом (success, error)"""
+    future = Future()
+    future.set_result((success, error))
+    return future
+
+
+class CatWriteBuffer:
+    """
+    Буфер відкладеного запису для update_cat_age та add_feature_to_cat.
+
+    Операції над одним котом, що надходять протягом max_delay_ms або поки
+    в буфері менше max_ops операцій, об'єднуються в один UpdateOne
+    ($set віку та $addToSet з $each для характеристик). Усі коти з вікна
+    записуються одним невпорядкованим bulk_write, а перевірка існування
+    виконується одним find з $in замість запиту на кожну операцію.
+
+    Кожен виклик повертає Future, результат якого — кортеж (success, error)
+    з тими самими повідомленнями, що й у cats_manager. Результати обчислюються
+    так, ніби операції вікна виконувались послідовно.
+    """
+
+    def __init__(
+        self,
+        collection,
+        max_delay_ms: int = WRITE_BUFFER_DELAY_MS,
+        max_ops: int = WRITE_BUFFER_MAX_OPS,
+    ):
+        self.collection = collection
+        # Стан котів читається з primary: за даними відсталої репліки записи
+        # могли б бути пропущені або позначені як "не знайдено"
+        self._reads = primary_collection(collection)
+        self.max_delay = max_delay_ms / 1000
+        self.max_ops = max_ops
+        self._pending = []  # (name, field, value, future)
+        self._first_pending_at = None
+        self._condition = threading.Condition()
+        # flush() з потоку користувача та фоновий потік не пишуть одночасно;
+        # вікно забирається вже під _write_lock, щоб вікна записувались у порядку
+        # надходження. Порядок блокувань: _write_lock, потім _condition
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="cat-write-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def update_cat_age(self, name: str, age: int) -> Future:
+        """Додає до буфера оновлення віку кота"""
+        is_valid, name_value, error = validate_name(name)
+        if not is_valid:
+            return _resolved(False, error)
+        return self._enqueue(name_value, "age", age)
+
+    def add_feature_to_cat(self, name: str, feature: str) -> Future:
+        """Додає до буфера нову характеристику кота"""
+        is_valid, name_value, error = validate_name(name)
+        if not is_valid:
+            return _resolved(False, error)
+
+        is_valid, features_list, error = validate_features(feature)
+        if not is_valid or not features_list:
+            return _resolved(False, error or "Характеристика не може бути порожньою")
+        return self._enqueue(name_value, "features", features_list[0])
+
+    def flush(self) -> None:
+        """Негайно записує всі операції з буфера"""
+        with self._write_lock:
+            with self._condition:
+                batch = self._take_pending()
+            self._write(batch)
+
+    def close(self) -> None:
+        """Записує залишок буфера та зупиняє фоновий потік"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+
+    def _enqueue(self, name: str, field: str, value) -> Future:
+        future = Future()
+        with self._condition:
+            if self._closed:
+                return _resolved(False, "Буфер запису закрито")
+            if not self._pending:
+                # Перша операція вікна запускає відлік max_delay у фоновому потоці
+                self._first_pending_at = time.monotonic()
+                self._condition.notify()
+            self._pending.append((name, field, value, future))
+            if len(self._pending) >= self.max_ops:
+                self._condition.notify()
+        return future
+
+    def _take_pending(self) -> list:
+        batch, self._pending = self._pending, []
+        self._first_pending_at = None
+        return batch
+
+    def _run(self) -> None:
+        """Фоновий потік: скидає буфер за часом або розміром"""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending:
+                        elapsed = time.monotonic() - self._first_pending_at
+                        if (
+                            len(self._pending) >= self.max_ops
+                            or elapsed >= self.max_delay
+                        ):
+                            break
+                        self._condition.wait(self.max_delay - elapsed)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+            # Якщо вікно вже записав flush() іншого потоку, записувати нічого
+            self.flush()
+
+    def _write(self, batch: list) -> None:
+        """Записує вікно під _write_lock; помилка завершує Future вікна, а не потік"""
+        if not batch:
+            return
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            logger.error(f"Неочікувана помилка буфера запису: {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result((False, str(e)))
+
+    def _write_batch(self, batch: list) -> None:
+        """Виконує один bulk_write для операцій вікна та завершує їх Future"""
+        names = list(dict.fromkeys(name for name, _, _, _ in batch))
+        try:
+            current = {
+                cat["name"]: cat
+                for cat in self._reads.find(
+                    {"name": {"$in": names}}, {"name": 1, "age": 1, "features": 1}
+                )
+            }
+        except PyMongoError as e:
+            logger.error(f"Помилка перевірки існування котів: {e}")
+            for *_, future in batch:
+                future.set_result((False, str(e)))
+            return
+
+        results = {}  # name -> [(future, success, error)]
+        updates = {}  # name -> {"$set": ..., "$addToSet": ...}
+        for name, field, value, future in batch:
+            outcome = results.setdefault(name, [])
+            cat = current.get(name)
+            if cat is None:
+                outcome.append((future, False, f"Кота з ім'ям '{name}' не знайдено"))
+                continue
+
+            update = updates.setdefault(name, {})
+            if field == "age":
+                if cat.get("age") == value:
+                    outcome.append(
+                        (
+                            future,
+                            False,
+                            "Вік не було оновлено (можливо, вказано той самий вік)",
+                        )
+                    )
+                    continue
+                cat["age"] = value
+                update.setdefault("$set", {})["age"] = value
+            else:
+                features = cat.setdefault("features", [])
+                if value in features:
+                    outcome.append((future, False, "Ця характеристика вже існує"))
+                    continue
+                features.append(value)
+                update.setdefault("$addToSet", {}).setdefault(
+                    "features", {"$each": []}
+                )["$each"].append(value)
+            outcome.append((future, True, None))
+
+        updated_names = [name for name, update in updates.items() if update]
+        failed = {}  # name -> error
+        if updated_names:
+            requests = [
+                UpdateOne({"name": name}, updates[name]) for name in updated_names
+            ]
+            try:
+                self.collection.bulk_write(requests, ordered=False)
+                invalidate_analytics(self.collection)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    name = updated_names[write_error["index"]]
+                    failed[name] = write_error.get("errmsg", str(e))
+                logger.error(f"Помилки пакетного оновлення котів: {failed}")
+                invalidate_analytics(self.collection)
+            except PyMongoError as e:
+                logger.error(f"Помилка пакетного оновлення котів: {e}")
+                failed = {name: str(e) for name in updated_names}
+
+        for name, outcome in results.items():
+            for future, success, error in outcome:
+                if success and name in failed:
+                    future.set_result((False, failed[name]))
+                else:
+                    future.set_result((success, error))